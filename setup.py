@@ -53,11 +53,15 @@ setup(
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
+            "pytest-xdist>=2.0",
             "black>=21.0",
             "flake8>=3.8",
             "mypy>=0.800",
             "pre-commit>=2.0",
         ],
+        "fast": [
+            "orjson>=3.0",
+        ],
     },
     entry_points={
         "console_scripts": [
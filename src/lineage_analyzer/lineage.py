@@ -14,14 +14,27 @@ Example:
     python lineage.py my_etl.sql --export lineage.json
 """
 
+import os
 import sys
+import io
+import contextlib
+import re
+import mmap
 import argparse
-from typing import Dict, List, Set, Optional, Tuple, Any
-from dataclasses import dataclass
+from typing import Dict, List, Set, Optional, Tuple, Any, Union, Iterator
+from dataclasses import dataclass, replace
 from pathlib import Path
 import json
 from datetime import datetime
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speed-up; fall back to the standard library
+    orjson = None
 
 # Import the SQLGlot parser
 try:
@@ -31,7 +44,81 @@ except ImportError:
     from sqlglot_parser import SQLGlotParser, ParsedOperation, ParsedTable
 
 
-@dataclass
+# Line comments, stripped before splitting a SQL block into statements
+_LINE_COMMENT_RE = re.compile(r"--.*$", re.MULTILINE)
+
+# Characters that drive statement splitting: parentheses nest, semicolons end
+_STATEMENT_DELIMITER_RE = re.compile(r"[();]")
+
+# Fallbacks for UPDATE statements whose target table SQLGlot couldn't resolve
+_TERADATA_UPDATE_RE = re.compile(r'UPDATE\s+(\w+)\s+FROM\s+([A-Za-z0-9_.]+)', re.IGNORECASE)
+_UPDATE_TABLE_RE = re.compile(r'UPDATE\s+([A-Za-z0-9_.]+)', re.IGNORECASE)
+_FROM_TABLE_RE = re.compile(r'FROM\s+([A-Za-z0-9_.]+)', re.IGNORECASE)
+_FROM_WHERE_TABLE_RE = re.compile(r'FROM\s+([A-Za-z0-9_.]+)\s+WHERE', re.IGNORECASE)
+
+# Operation types (besides CREATE_VOLATILE) whose target table is a lineage target
+_TARGET_OPERATION_TYPES = frozenset(["CREATE_VIEW", "INSERT", "UPDATE", "DELETE"])
+
+# Files at least this large are memory-mapped rather than read through a text stream
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Any non-whitespace byte; lets blank files skip decoding entirely
+_NON_BLANK_BYTES_RE = re.compile(rb"\S")
+
+# Maximum number of distinct statements whose parse results are kept per analyzer
+_PARSE_CACHE_SIZE = 4096
+
+# Folders with fewer scripts than this are processed in-process, where
+# starting worker processes would cost more than it saves
+_MIN_PARALLEL_SCRIPTS = 4
+
+
+def _normalize_newlines(content: str) -> str:
+    """Translate CRLF and CR line endings to LF, as a text-mode read would
+
+    Files are opened with newline="" so scripts without carriage returns,
+    the common case, skip the newline translation entirely.
+    """
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+@lru_cache(maxsize=2048)
+def _format_sql_statement(sql_statement: str) -> str:
+    """Pretty-print a statement for the JSON export
+
+    export_to_json formats every statement twice (to collect unique
+    statements, then to look up their index), and boilerplate statements
+    repeat across the scripts a process handles, so results are cached.
+    """
+    import sqlparse
+    try:
+        return sqlparse.format(
+            sql_statement,
+            reindent=True,
+            keyword_case='upper',
+            strip_comments=False,
+            use_space_around_operators=True,
+            indent_width=4
+        ).strip()
+    except Exception:
+        # Fallback to original if formatting fails
+        return sql_statement
+
+
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    """Serialize lineage data as 2-space indented UTF-8 JSON, using orjson when available
+
+    The json fallback keeps the stdlib's default ASCII escaping, so its
+    output is byte-for-byte what export_to_json wrote before orjson support.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+@dataclass(slots=True)
 class TableOperation:
     """Represents a table operation (CREATE, INSERT, UPDATE, etc.)"""
 
@@ -46,7 +133,7 @@ class TableOperation:
     is_view: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class LineageInfo:
     """Complete lineage information for an ETL script"""
 
@@ -68,13 +155,27 @@ class ETLLineageAnalyzerSQLGlot:
         Args:
             dialect: SQL dialect to use ('teradata', 'spark', 'spark2', etc.)
         """
+        self.dialect = dialect
         self.parser = SQLGlotParser(dialect)
         self.logger = logging.getLogger(__name__)
+        # Parse results keyed by statement text, shared across every script
+        # this analyzer processes (ETL scripts repeat a lot of boilerplate)
+        self._parse_cache: Dict[str, Optional[ParsedOperation]] = {}
 
-    def extract_sql_blocks(self, content: str) -> List[str]:
-        """Extract SQL blocks from SQL file content"""
-        # For SQL files, the entire content is the SQL block
-        if content.strip():
+    def extract_sql_blocks(self, content: Union[str, bytes, mmap.mmap]) -> List[str]:
+        """Extract SQL blocks from SQL file content
+        
+        Raw bytes (or a memory-mapped file) are only decoded when they hold
+        something other than whitespace.
+        """
+        if not isinstance(content, str):
+            if not _NON_BLANK_BYTES_RE.search(content):
+                return []
+            content = _normalize_newlines(str(content, "utf-8", "ignore"))
+        
+        # For SQL files, the entire content is the SQL block. isspace() stops
+        # at the first non-blank character and, unlike strip(), never copies
+        if content and not content.isspace():
             return [content]
         return []
 
@@ -89,11 +190,17 @@ class ETLLineageAnalyzerSQLGlot:
         # Split into individual statements and track their offsets
         statements_with_offsets = self._split_sql_statements_with_offsets(sql_block)
         
+        # Offsets only increase, so count newlines incrementally rather
+        # than re-scanning the block prefix for every statement
+        line_number = 1
+        previous_offset = 0
+        
         for statement, offset in statements_with_offsets:
-            line_number = self._offset_to_line_number(sql_block, offset)
+            line_number += sql_block.count("\n", previous_offset, offset)
+            previous_offset = offset
             
             # Parse using SQLGlot
-            parsed_operation = self.parser.parse_sql_statement(statement, line_number)
+            parsed_operation = self._parse_statement(statement, line_number)
             
             if parsed_operation:
                 # Convert ParsedOperation to TableOperation
@@ -107,57 +214,68 @@ class ETLLineageAnalyzerSQLGlot:
         
         return operations
 
+    def _parse_statement(self, statement: str, line_number: int) -> Optional[ParsedOperation]:
+        """Parse a statement, reusing the result if the same text was parsed before"""
+        if statement in self._parse_cache:
+            cached = self._parse_cache[statement]
+            if cached is None:
+                return None
+            return replace(cached, line_number=line_number)
+        
+        parsed_operation = self.parser.parse_sql_statement(statement, line_number)
+        
+        # Evict the oldest entry once the cache is full
+        if len(self._parse_cache) >= _PARSE_CACHE_SIZE:
+            del self._parse_cache[next(iter(self._parse_cache))]
+        self._parse_cache[statement] = parsed_operation
+        
+        return parsed_operation
+
     def _split_sql_statements_with_offsets(self, sql_block: str) -> List[Tuple[str, int]]:
         """Split SQL block into statements and return (statement, char_offset) tuples"""
-        import re
-        
         # Remove comments
-        sql_clean = re.sub(r"--.*$", "", sql_block, flags=re.MULTILINE)
+        sql_clean = _LINE_COMMENT_RE.sub("", sql_block)
         # sql_clean = re.sub(r"/\s*\*.*?\*/", "", sql_clean, flags=re.DOTALL)
         
         statements = []
-        current_statement = ""
         paren_count = 0
         start_offset = 0
         
-        for i, char in enumerate(sql_clean):
-            if not current_statement:
-                start_offset = i
-            current_statement += char
-            
+        # Only parentheses and semicolons affect splitting, so jump between
+        # them and slice each statement out once
+        for match in _STATEMENT_DELIMITER_RE.finditer(sql_clean):
+            char = match.group()
             if char == "(":
                 paren_count += 1
             elif char == ")":
                 paren_count -= 1
-            elif char == ";" and paren_count == 0:
-                statements.append((current_statement.strip(), start_offset))
-                current_statement = ""
+            elif paren_count == 0:
+                end_offset = match.end()
+                statements.append((sql_clean[start_offset:end_offset].strip(), start_offset))
+                start_offset = end_offset
         
-        if current_statement.strip():
-            statements.append((current_statement.strip(), start_offset))
+        trailing_statement = sql_clean[start_offset:].strip()
+        if trailing_statement:
+            statements.append((trailing_statement, start_offset))
         
         return statements
 
-    def _offset_to_line_number(self, sql_block: str, offset: int) -> int:
-        """Convert a character offset to a line number in the original SQL block"""
-        upto = sql_block[:offset]
-        return upto.count("\n") + 1
-
     def _convert_parsed_operation_to_table_operation(
         self, parsed_operation: ParsedOperation, sql_statement: str
     ) -> Optional[TableOperation]:
         """Convert ParsedOperation to TableOperation format"""
         
-        # Convert target table
+        # Convert target table. Canonical names are interned: the same few
+        # tables recur across thousands of operations, sets and dict keys.
         target_table = ""
         if parsed_operation.target_table:
-            target_table = parsed_operation.target_table.full_name.upper()
+            target_table = sys.intern(parsed_operation.target_table.full_name.upper())
         
         # Convert source tables
         source_tables = []
         for table in parsed_operation.source_tables:
             if table.full_name:
-                source_tables.append(table.full_name.upper())
+                source_tables.append(sys.intern(table.full_name.upper()))
         
         # Determine operation type with more specific types
         operation_type = parsed_operation.operation_type
@@ -178,19 +296,32 @@ class ETLLineageAnalyzerSQLGlot:
             is_view=parsed_operation.is_view
         )
 
+    def _read_sql_blocks(self, script_path: Path) -> List[str]:
+        """Read a SQL file and extract its SQL blocks, memory-mapping large files"""
+        if script_path.stat().st_size < _MMAP_THRESHOLD:
+            with open(script_path, "r", encoding="utf-8", errors="ignore", newline="") as f:
+                return self.extract_sql_blocks(_normalize_newlines(f.read()))
+
+        with open(script_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return self.extract_sql_blocks(buffer)
+
     def analyze_script(self, script_path: str) -> LineageInfo:
         """Analyze a SQL file and extract lineage information using SQLGlot"""
         script_path_obj = Path(script_path)
-        warnings = []
 
         if not script_path_obj.exists():
             raise FileNotFoundError(f"SQL file not found: {script_path_obj}")
 
-        with open(script_path_obj, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
+        return self._analyze_sql_blocks(self._read_sql_blocks(script_path_obj), script_path_obj.name)
+
+    def analyze_sql(self, sql: str, script_name: str) -> LineageInfo:
+        """Analyze SQL (or shell script) text in memory without touching the filesystem"""
+        return self._analyze_sql_blocks(self.extract_sql_blocks(_normalize_newlines(sql)), script_name)
 
-        # Extract SQL blocks
-        sql_blocks = self.extract_sql_blocks(content)
+    def _analyze_sql_blocks(self, sql_blocks: List[str], script_name: str) -> LineageInfo:
+        """Build lineage information from the SQL blocks of one script"""
+        warnings = []
 
         if not sql_blocks:
             warnings.append("No SQL content found in the file")
@@ -202,39 +333,31 @@ class ETLLineageAnalyzerSQLGlot:
         # Extract operations using SQLGlot parser
         operations = self.extract_operations(combined_sql, warnings)
 
-        # Separate source and target tables
+        # Separate source and target tables and build table relationships
+        # in a single pass over the operations
         source_tables = set()
         target_tables = set()
         volatile_tables = []
+        table_relationships: Dict[str, List[str]] = {}
 
         for operation in operations:
+            # Filter out empty source table names
+            valid_source_tables = [table for table in operation.source_tables if table and table.strip()]
+            source_tables.update(valid_source_tables)
+
             # Filter out empty table names
             if operation.target_table and operation.target_table.strip():
                 if operation.operation_type == "CREATE_VOLATILE":
                     volatile_tables.append(operation.target_table)
                     target_tables.add(operation.target_table)
-                elif operation.operation_type == "CREATE_VIEW":
-                    target_tables.add(operation.target_table)
-                elif operation.operation_type in ["INSERT", "UPDATE", "DELETE"]:
+                elif operation.operation_type in _TARGET_OPERATION_TYPES:
                     target_tables.add(operation.target_table)
-            
-            # Filter out empty source table names
-            valid_source_tables = [table for table in operation.source_tables if table and table.strip()]
-            source_tables.update(valid_source_tables)
 
-        # Build table relationships
-        table_relationships: Dict[str, List[str]] = {}
-        for operation in operations:
-            # Only process operations with valid target tables
-            if operation.target_table and operation.target_table.strip():
-                if operation.target_table not in table_relationships:
-                    table_relationships[operation.target_table] = []
-                # Filter out empty source table names
-                valid_source_tables = [table for table in operation.source_tables if table and table.strip()]
-                table_relationships[operation.target_table].extend(valid_source_tables)
+                # Only operations with valid target tables add relationships
+                table_relationships.setdefault(operation.target_table, []).extend(valid_source_tables)
 
         return LineageInfo(
-            script_name=script_path_obj.name,
+            script_name=script_name,
             volatile_tables=volatile_tables,
             source_tables=source_tables,
             target_tables=target_tables,
@@ -315,10 +438,8 @@ class ETLLineageAnalyzerSQLGlot:
                 sources = " + ".join(op.source_tables) if op.source_tables else "N/A"
                 print(f"      {sources} → {op.target_table}")
 
-    def export_to_json(
-        self, lineage_info: LineageInfo, output_file: Optional[str] = None
-    ) -> None:
-        """Export lineage information to JSON format with data flows for each table"""
+    def to_json_dict(self, lineage_info: LineageInfo) -> Dict[str, Any]:
+        """Build the JSON export structure with data flows for each table"""
         
         # Get all unique tables (filter out empty names)
         all_tables = set()
@@ -338,19 +459,7 @@ class ETLLineageAnalyzerSQLGlot:
                 continue
             
             # Format the SQL statement using sqlparse
-            import sqlparse
-            try:
-                formatted_statement = sqlparse.format(
-                    cleaned_statement,
-                    reindent=True,
-                    keyword_case='upper',
-                    strip_comments=False,
-                    use_space_around_operators=True,
-                    indent_width=4
-                ).strip()
-            except Exception:
-                # Fallback to original if formatting fails
-                formatted_statement = cleaned_statement
+            formatted_statement = _format_sql_statement(cleaned_statement)
             
             # Add to bteq_statements if not already present
             if formatted_statement not in statement_to_index:
@@ -363,9 +472,10 @@ class ETLLineageAnalyzerSQLGlot:
             if operation.is_view and operation.target_table:
                 view_tables.add(operation.target_table)
         
-        # Initialize data structure for each table
+        # Initialize data structure for each table, in sorted order so the
+        # export does not depend on set iteration order
         tables_data = {}
-        for table in all_tables:
+        for table in sorted(all_tables):
             tables_data[table] = {
                 "source": [],
                 "target": [],
@@ -390,14 +500,13 @@ class ETLLineageAnalyzerSQLGlot:
                 # Try to infer target table from SQL statement for UPDATE operations
                 if operation_type == "UPDATE":
                     # Look for UPDATE table_name pattern in the SQL
-                    import re
-                    update_match = re.search(r'UPDATE\s+(\w+)\s+FROM\s+([A-Za-z0-9_.]+)', cleaned_statement, re.IGNORECASE)
+                    update_match = _TERADATA_UPDATE_RE.search(cleaned_statement)
                     if update_match:
                         # The target table is the second part (after FROM)
                         target_table = update_match.group(2)
                     else:
                         # Try standard UPDATE table_name pattern
-                        update_match = re.search(r'UPDATE\s+([A-Za-z0-9_.]+)', cleaned_statement, re.IGNORECASE)
+                        update_match = _UPDATE_TABLE_RE.search(cleaned_statement)
                         if update_match:
                             target_table = update_match.group(1)
                 
@@ -408,32 +517,20 @@ class ETLLineageAnalyzerSQLGlot:
                 # For Teradata UPDATE statements, also extract source tables using regex
                 if operation_type == "UPDATE":
                     # Extract tables from FROM clause using regex
-                    from_match = re.search(r'FROM\s+([A-Za-z0-9_.]+)', cleaned_statement, re.IGNORECASE)
+                    from_match = _FROM_TABLE_RE.search(cleaned_statement)
                     if from_match:
                         from_table = from_match.group(1)
                         if from_table not in source_tables:
                             source_tables.append(from_table)
                     
                     # Extract tables from subqueries in FROM clause
-                    subquery_matches = re.findall(r'FROM\s+([A-Za-z0-9_.]+)\s+WHERE', cleaned_statement, re.IGNORECASE)
+                    subquery_matches = _FROM_WHERE_TABLE_RE.findall(cleaned_statement)
                     for subquery_table in subquery_matches:
                         if subquery_table not in source_tables:
                             source_tables.append(subquery_table)
             
             # Format the SQL statement using sqlparse
-            import sqlparse
-            try:
-                formatted_statement = sqlparse.format(
-                    cleaned_statement,
-                    reindent=True,
-                    keyword_case='upper',
-                    strip_comments=False,
-                    use_space_around_operators=True,
-                    indent_width=4
-                ).strip()
-            except Exception:
-                # Fallback to original if formatting fails
-                formatted_statement = cleaned_statement
+            formatted_statement = _format_sql_statement(cleaned_statement)
             
             # Get the index of the formatted SQL statement
             statement_index = statement_to_index[formatted_statement]
@@ -482,34 +579,35 @@ class ETLLineageAnalyzerSQLGlot:
                             "operation": [statement_index]
                         })
         
-        # Add warning if no BTEQ statements were found
-        if not bteq_statements:
-            print(f"⚠️ Warning: No BTEQ statements found in {lineage_info.script_name}. This might indicate:")
-            print(f"   - No SQL content detected in the file")
-            print(f"   - File contains only comments or empty content")
-        
-        # Create sorted tables data for consistent JSON output
-        sorted_tables_data = {}
-        for table_name in sorted(tables_data.keys()):
-            sorted_tables_data[table_name] = tables_data[table_name]
-        
-        data = {
+        return {
             "script_name": lineage_info.script_name,
             "parser_version": "SQLGlot",
             "bteq_statements": bteq_statements,
-            "tables": sorted_tables_data,
+            "tables": tables_data,
             "warnings": lineage_info.warnings
         }
 
+    def export_to_json(
+        self, lineage_info: LineageInfo, output_file: Optional[str] = None
+    ) -> None:
+        """Export lineage information to JSON format with data flows for each table"""
+        data = self.to_json_dict(lineage_info)
+
+        # Add warning if no BTEQ statements were found
+        if not data["bteq_statements"]:
+            print(f"⚠️ Warning: No BTEQ statements found in {lineage_info.script_name}. This might indicate:")
+            print(f"   - No SQL content detected in the file")
+            print(f"   - File contains only comments or empty content")
+
         if output_file:
             # Delete existing file if it exists
             if Path(output_file).exists():
                 Path(output_file).unlink()
-            with open(output_file, "w") as f:
-                json.dump(data, f, indent=2)
+            with open(output_file, "wb") as f:
+                f.write(_dump_json(data))
             print(f"\n💾 Lineage data exported to: {output_file}")
         else:
-            print(json.dumps(data, indent=2))
+            print(_dump_json(data).decode("utf-8"))
 
     def export_to_bteq_sql(self, lineage_info: LineageInfo, output_file: str, original_script_path: str = None) -> None:
         """Export SQL content to a .bteq file"""
@@ -554,8 +652,21 @@ class ETLLineageAnalyzerSQLGlot:
         else:
             print(f"⚠️ Warning: No SQL content found in {script_path}")
 
-    def process_folder(self, input_folder: str, output_folder: str) -> None:
-        """Process all .sql files in the input folder and generate reports in the output folder"""
+    def process_folder(
+        self, input_folder: str, output_folder: str, max_workers: Optional[int] = 1
+    ) -> None:
+        """Process all .sql files in the input folder and generate reports in the output folder
+
+        Args:
+            input_folder: Folder containing the .sql files to analyze
+            output_folder: Folder for the JSON and .bteq reports
+            max_workers: Number of worker processes to analyze scripts in, or
+                None for one per CPU. The default of 1 processes every script
+                in this process. With more workers, each holds a copy of this
+                analyzer, and on platforms that spawn workers (macOS, Windows)
+                the calling script must guard its entry point with
+                ``if __name__ == "__main__":``.
+        """
         input_path = Path(input_folder)
         output_path = Path(output_folder)
 
@@ -565,8 +676,13 @@ class ETLLineageAnalyzerSQLGlot:
         # Create output folder if it doesn't exist
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Find all .sql files
-        script_files = list(input_path.glob("*.sql"))
+        # Find all .sql files; scandir entries carry their file type, so no
+        # extra stat() is needed per file
+        with os.scandir(input_path) as entries:
+            script_files = sorted(
+                entry.path for entry in entries
+                if entry.name.endswith(".sql") and entry.is_file()
+            )
 
         if not script_files:
             print(f"No .sql files found in {input_folder}")
@@ -580,34 +696,27 @@ class ETLLineageAnalyzerSQLGlot:
         total_warnings = 0
         files_with_warnings = 0
 
-        for script_file in script_files:
-            try:
-                print(f"\nProcessing: {script_file.name}")
-                lineage_info = self.analyze_script(str(script_file))
-
-                # Track warnings
-                if lineage_info.warnings:
-                    total_warnings += len(lineage_info.warnings)
-                    files_with_warnings += 1
-                    print(f"⚠️ Found {len(lineage_info.warnings)} warnings in {script_file.name}")
-
-                # Generate JSON report with extension included
-                json_file = (
-                    output_path
-                    / f"{script_file.stem}_{script_file.suffix[1:]}_lineage.json"
-                )
-                self.export_to_json(lineage_info, str(json_file))
+        # Scripts are independent, so larger folders can be analyzed in worker processes
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(script_files))
+        if max_workers <= 1 or len(script_files) < _MIN_PARALLEL_SCRIPTS:
+            results = (self._process_script_file(script_file, output_path) for script_file in script_files)
+        else:
+            results = self._process_scripts_in_parallel(script_files, output_path, max_workers)
 
-                # Generate BTEQ SQL file
-                bteq_file = output_path / f"{script_file.stem}.bteq"
-                self.export_to_bteq_sql(lineage_info, str(bteq_file), str(script_file))
+        for script_file, (warning_count, error) in zip(script_files, results):
+            script_name = Path(script_file).name
+            if error is not None:
+                failed_files.append((script_name, error))
+                continue
 
-                successful_files.append(script_file.name)
-                print(f"✅ Successfully processed {script_file.name}")
+            # Track warnings
+            if warning_count:
+                total_warnings += warning_count
+                files_with_warnings += 1
 
-            except Exception as e:
-                failed_files.append((script_file.name, str(e)))
-                print(f"❌ Failed to process {script_file.name}: {e}")
+            successful_files.append(script_name)
 
         # Generate summary report
         summary_file = output_path / "processing_summary.yaml"
@@ -671,6 +780,78 @@ class ETLLineageAnalyzerSQLGlot:
         
         print(f"   • JSON files list: {json_files_list}")
 
+    def _process_scripts_in_parallel(
+        self, script_files: List[str], output_path: Path, max_workers: int
+    ) -> Iterator[Tuple[int, Optional[str]]]:
+        """Process scripts in worker processes, yielding (warning count, error) in order
+
+        Each script's console output is printed by this process, in order,
+        as soon as its result is available.
+        """
+        # Several chunks per worker keep the load balanced when script sizes vary
+        chunksize = max(1, len(script_files) // (max_workers * 4))
+        tasks = [(script_file, str(output_path)) for script_file in script_files]
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(self,)
+        ) as executor:
+            for warning_count, error, output in executor.map(
+                _process_script_in_worker, tasks, chunksize=chunksize
+            ):
+                print(output, end="")
+                yield warning_count, error
+
+    def _process_script_file(self, script_path: str, output_path: Path) -> Tuple[int, Optional[str]]:
+        """Analyze one script and write its reports, printing progress as it goes
+
+        Returns:
+            Tuple of (warning count, error message or None)
+        """
+        script_file = Path(script_path)
+        try:
+            print(f"\nProcessing: {script_file.name}")
+            lineage_info = self.analyze_script(script_path)
+
+            # Track warnings
+            if lineage_info.warnings:
+                print(f"⚠️ Found {len(lineage_info.warnings)} warnings in {script_file.name}")
+
+            # Generate JSON report with extension included
+            json_file = output_path / f"{script_file.stem}_{script_file.suffix[1:]}_lineage.json"
+            self.export_to_json(lineage_info, str(json_file))
+
+            # Generate BTEQ SQL file
+            bteq_file = output_path / f"{script_file.stem}.bteq"
+            self.export_to_bteq_sql(lineage_info, str(bteq_file), script_path)
+
+            print(f"✅ Successfully processed {script_file.name}")
+            return len(lineage_info.warnings), None
+        except Exception as e:
+            print(f"❌ Failed to process {script_file.name}: {e}")
+            return 0, str(e)
+
+
+# Analyzer that process_folder hands to its worker processes
+_worker_analyzer: Optional["ETLLineageAnalyzerSQLGlot"] = None
+
+
+def _init_worker(analyzer: "ETLLineageAnalyzerSQLGlot") -> None:
+    """Install the analyzer process_folder was called on in a worker process"""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _process_script_in_worker(task: Tuple[str, str]) -> Tuple[int, Optional[str], str]:
+    """Process one script on the worker's analyzer (module-level so it can be pickled)
+
+    Returns:
+        Tuple of (warning count, error message or None, console output)
+    """
+    script_path, output_folder = task
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        warning_count, error = _worker_analyzer._process_script_file(script_path, Path(output_folder))
+    return warning_count, error, output.getvalue()
+
 
 def main() -> None:
     """Main function to run the ETL lineage analyzer with SQLGlot"""
@@ -693,6 +874,9 @@ Examples:
   
   # Analyze Spark2 SQL files
   python lineage.py spark2_files/ reports/ --dialect spark2
+
+  # Analyze a folder with one worker process per CPU
+  python lineage.py sql_files/ reports/ --workers 0
         """,
     )
 
@@ -722,6 +906,13 @@ Examples:
         help="SQL dialect to use for parsing (default: teradata)"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes to analyze a folder's scripts in (default: 1, 0 for one per CPU)"
+    )
+
     args = parser.parse_args()
 
     try:
@@ -772,7 +963,7 @@ Examples:
             if not args.output_folder:
                 print("❌ Error: Output folder is required when processing folders for lineage analysis")
                 sys.exit(1)
-            analyzer.process_folder(args.input, args.output_folder)
+            analyzer.process_folder(args.input, args.output_folder, args.workers or None)
 
         else:
             print(f"❌ Error: Input path does not exist: {args.input}")
@@ -7,16 +7,62 @@ It specifically handles Teradata SQL syntax and provides better accuracy for com
 """
 
 import logging
+import re
 from typing import List, Dict, Set, Optional, Tuple, Any
 from dataclasses import dataclass
 import sqlglot
 from sqlglot import parse_one, parse, Dialect
 from sqlglot.expressions import Select, Insert, Update, Delete, Create, Drop, Alter, Merge, CTE
 from sqlglot.expressions import Table, Column, Alias, Join, Union, Subquery, Where, And, Or, Not, In, From
+from sqlglot.expressions import Literal, Interval, DataType, Null, Boolean, Identifier
 from sqlglot.dialects import Teradata, Spark, Spark2
 
 
-@dataclass
+# Line comment together with the whitespace before it
+_LINE_COMMENT_RE = re.compile(r'[^\S\n]*--[^\n]*')
+# Whitespace-only lines, and a whitespace-only last line
+_BLANK_LINE_RE = re.compile(r'^[^\S\n]*\n', re.MULTILINE)
+_TRAILING_BLANK_LINE_RE = re.compile(r'(?:\A|\n)[^\S\n]*\Z')
+
+
+# Supported dialect names and the SQLGlot dialect classes they map to
+_DIALECTS = {
+    "teradata": Teradata,
+    "spark": Spark,
+    "spark2": Spark2,
+}
+
+# Operation type of each statement class, checked in this order for
+# expressions that are not exactly one of these classes
+_OPERATION_TYPES = {
+    Select: "SELECT",
+    Insert: "INSERT",
+    Update: "UPDATE",
+    Delete: "DELETE",
+    Create: "CREATE",
+    Drop: "DROP",
+    Alter: "ALTER",
+    Merge: "MERGE",
+    CTE: "CTE",
+}
+
+# Parser method handling each operation type; anything else goes to _parse_other
+_OPERATION_PARSERS = {
+    "SELECT": "_parse_select",
+    "INSERT": "_parse_insert",
+    "UPDATE": "_parse_update",
+    "DELETE": "_parse_delete",
+    "CREATE": "_parse_create",
+    "DROP": "_parse_drop",
+    "ALTER": "_parse_alter",
+    "MERGE": "_parse_merge",
+}
+
+# Leaf expressions that can never contain a table reference
+_LEAF_TYPES = (Literal, Interval, DataType, Null, Boolean, Identifier, Column)
+
+
+@dataclass(slots=True)
 class ParsedTable:
     """Represents a parsed table reference"""
     name: str
@@ -38,7 +84,7 @@ class ParsedTable:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedOperation:
     """Represents a parsed SQL operation"""
     operation_type: str
@@ -55,6 +101,17 @@ class ParsedOperation:
 class SQLGlotParser:
     """SQLGlot-based SQL parser for SQL statements with configurable dialect support"""
     
+    # SQL keywords to filter out. Shared by every instance so building a
+    # parser (one per analyzer, per worker process) doesn't rebuild them.
+    sql_keywords = {
+        "SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "DROP", "ALTER", "MERGE",
+        "FROM", "JOIN", "LEFT", "RIGHT", "INNER", "OUTER", "WHERE", "AND", "OR",
+        "IN", "EXISTS", "UNION", "CASE", "WHEN", "THEN", "ELSE", "END", "GROUP",
+        "BY", "ORDER", "HAVING", "DISTINCT", "COALESCE", "NULL", "AS", "ON",
+        "BT", "ET", "WITH", "DATA", "ON", "COMMIT", "PRESERVE", "ROWS", "SEL",
+        "CHARACTERS", "TRIM", "SUBSTR", "SUBSTRING", "CURRENT_TIMESTAMP", "CAST"
+    }
+    
     def __init__(self, dialect: str = "teradata"):
         """Initialize the SQLGlot parser with specified dialect support
         
@@ -63,19 +120,17 @@ class SQLGlotParser:
         """
         self.logger = logging.getLogger(__name__)
         self.dialect = self._get_dialect(dialect)
-        
-        # SQL keywords to filter out
-        self.sql_keywords = {
-            "SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "DROP", "ALTER", "MERGE",
-            "FROM", "JOIN", "LEFT", "RIGHT", "INNER", "OUTER", "WHERE", "AND", "OR",
-            "IN", "EXISTS", "UNION", "CASE", "WHEN", "THEN", "ELSE", "END", "GROUP",
-            "BY", "ORDER", "HAVING", "DISTINCT", "COALESCE", "NULL", "AS", "ON",
-            "BT", "ET", "WITH", "DATA", "ON", "COMMIT", "PRESERVE", "ROWS", "SEL",
-            "CHARACTERS", "TRIM", "SUBSTR", "SUBSTRING", "CURRENT_TIMESTAMP", "CAST"
-        }
-        
-        # Common single-letter aliases to ignore
-        self.common_aliases = set("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the dialect by class, since SQLGlot dialect instances do not unpickle"""
+        state = self.__dict__.copy()
+        state["dialect"] = type(self.dialect)
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled parser, re-creating its dialect instance"""
+        state["dialect"] = state["dialect"]()
+        self.__dict__.update(state)
     
     def _get_dialect(self, dialect: str) -> Dialect:
         """Get the appropriate SQLGlot dialect object based on the dialect string
@@ -89,18 +144,14 @@ class SQLGlotParser:
         Raises:
             ValueError: If the dialect is not supported
         """
-        dialect_map = {
-            "teradata": Teradata(),
-            "spark": Spark(),
-            "spark2": Spark2(),
-        }
-        
-        dialect_lower = dialect.lower()
-        if dialect_lower not in dialect_map:
-            supported_dialects = ", ".join(dialect_map.keys())
+        dialect_class = _DIALECTS.get(dialect.lower())
+        if dialect_class is None:
+            supported_dialects = ", ".join(_DIALECTS)
             raise ValueError(f"Unsupported dialect '{dialect}'. Supported dialects: {supported_dialects}")
         
-        return dialect_map[dialect_lower]
+        # Only the requested dialect is instantiated, and the instance is
+        # passed straight to parse_one so SQLGlot never has to look it up
+        return dialect_class()
     
     def parse_sql_statement(self, sql: str, line_number: int = 1) -> Optional[ParsedOperation]:
         """
@@ -131,70 +182,37 @@ class SQLGlotParser:
                 return None
             
             # Extract tables and other information based on operation type
-            if operation_type == "SELECT":
-                return self._parse_select(parsed, cleaned_sql, line_number)
-            elif operation_type == "INSERT":
-                return self._parse_insert(parsed, cleaned_sql, line_number)
-            elif operation_type == "UPDATE":
-                return self._parse_update(parsed, cleaned_sql, line_number)
-            elif operation_type == "DELETE":
-                return self._parse_delete(parsed, cleaned_sql, line_number)
-            elif operation_type == "CREATE":
-                return self._parse_create(parsed, cleaned_sql, line_number)
-            elif operation_type == "DROP":
-                return self._parse_drop(parsed, cleaned_sql, line_number)
-            elif operation_type == "ALTER":
-                return self._parse_alter(parsed, cleaned_sql, line_number)
-            elif operation_type == "MERGE":
-                return self._parse_merge(parsed, cleaned_sql, line_number)
-            else:
+            handler_name = _OPERATION_PARSERS.get(operation_type)
+            if handler_name is None:
                 return self._parse_other(parsed, cleaned_sql, line_number, operation_type)
-                
+            return getattr(self, handler_name)(parsed, cleaned_sql, line_number)
+            
         except Exception as e:
             self.logger.error(f"Error parsing SQL at line {line_number}: {e}")
             return None
     
     def _clean_sql(self, sql: str) -> str:
         """Clean SQL statement by removing comments and extra whitespace"""
-        # Remove line comments
-        lines = sql.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            # Find comment position
-            comment_pos = line.find('--')
-            if comment_pos != -1:
-                line = line[:comment_pos].rstrip()
-            if line.strip():
-                cleaned_lines.append(line)
-        
-        return '\n'.join(cleaned_lines)
+        # Remove line comments, then drop the lines left blank
+        sql = _LINE_COMMENT_RE.sub('', sql)
+        sql = _BLANK_LINE_RE.sub('', sql)
+        return _TRAILING_BLANK_LINE_RE.sub('', sql)
     
     def _get_operation_type(self, parsed) -> Optional[str]:
         """Determine the SQL operation type from parsed AST"""
-        if isinstance(parsed, Select):
+        # Parsed statements are almost always exactly one of the known classes
+        operation_type = _OPERATION_TYPES.get(type(parsed))
+        if operation_type:
+            return operation_type
+        
+        for statement_class, operation_type in _OPERATION_TYPES.items():
+            if isinstance(parsed, statement_class):
+                return operation_type
+        
+        # Check if it's a CTE or other complex statement
+        if hasattr(parsed, 'this') and isinstance(parsed.this, Select):
             return "SELECT"
-        elif isinstance(parsed, Insert):
-            return "INSERT"
-        elif isinstance(parsed, Update):
-            return "UPDATE"
-        elif isinstance(parsed, Delete):
-            return "DELETE"
-        elif isinstance(parsed, Create):
-            return "CREATE"
-        elif isinstance(parsed, Drop):
-            return "DROP"
-        elif isinstance(parsed, Alter):
-            return "ALTER"
-        elif isinstance(parsed, Merge):
-            return "MERGE"
-        elif isinstance(parsed, CTE):
-            return "CTE"
-        else:
-            # Check if it's a CTE or other complex statement
-            if hasattr(parsed, 'this') and isinstance(parsed.this, Select):
-                return "SELECT"
-            return "OTHER"
+        return "OTHER"
     
     def _parse_select(self, parsed: Select, sql: str, line_number: int) -> ParsedOperation:
         """Parse SELECT statement"""
@@ -476,6 +494,9 @@ class SQLGlotParser:
     
     def _extract_tables_from_expression(self, expression, alias_map: Dict[str, str] = None) -> List[ParsedTable]:
         """Recursively extract table references from any expression"""
+        if isinstance(expression, _LEAF_TYPES):
+            return []
+        
         tables = []
         
         if isinstance(expression, Table):
@@ -573,13 +594,14 @@ class SQLGlotParser:
     
     def _is_valid_table_name(self, name: str) -> bool:
         """Check if a table name is valid (not a keyword or alias)"""
-        if not name or not name.strip():
+        if not name:
             return False
         
         name = name.strip()
         
-        # Check for spaces and hyphens in the original name (before converting to uppercase)
-        if ' ' in name or '-' in name:
+        # Must be longer than 1 character, which also rules out single-letter
+        # aliases. Check for spaces and hyphens before converting to uppercase
+        if len(name) < 2 or ' ' in name or '-' in name:
             return False
         
         name = name.upper()
@@ -588,12 +610,8 @@ class SQLGlotParser:
         if name in self.sql_keywords:
             return False
         
-        # Skip single-letter aliases
-        if len(name) == 1 and name in self.common_aliases:
-            return False
-        
-        # Must contain at least one letter and be longer than 1 character
-        return len(name) > 1 and any(c.isalpha() for c in name)
+        # Must contain at least one letter
+        return any(c.isalpha() for c in name)
     
     def _is_volatile_table(self, parsed: Create) -> bool:
         """Check if CREATE statement creates a volatile table"""
@@ -7,7 +7,9 @@ Simple wrapper script to extract SQL statements from shell files.
 
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import Iterator, List, Tuple
 
 # Add the current directory to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -67,17 +69,50 @@ def process_single_file(input_file: Path, output_folder: str) -> bool:
     return extractor.extract()
 
 
+def iter_shell_files(input_dir: Path) -> Iterator[Path]:
+    """Yield the .sh files directly inside a directory."""
+    # os.scandir reuses the directory listing's file type info, so large
+    # folders don't need an extra stat() per entry
+    with os.scandir(input_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".sh") and entry.is_file():
+                yield Path(entry.path)
+
+
+def _extract_files(sh_files: List[Path], output_folder: str) -> Iterator[Tuple[Path, bool]]:
+    """Extract each shell file, yielding (file, success) as each one finishes.
+    
+    A single file is extracted in-process; several are spread across
+    worker processes, at most one per file.
+    """
+    if len(sh_files) == 1:
+        print(f"\n📄 Processing: {sh_files[0].name}")
+        yield sh_files[0], process_single_file(sh_files[0], output_folder)
+        return
+    
+    max_workers = min(os.cpu_count() or 1, len(sh_files))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(process_single_file, file_path, output_folder): file_path
+            for file_path in sh_files
+        }
+        for future in as_completed(futures):
+            file_path = futures[future]
+            print(f"\n📄 Processed: {file_path.name}")
+            yield file_path, future.result()
+
+
 def process_directory(input_dir: Path, output_folder: str) -> bool:
     """Process all .sh files in a directory."""
     # Find all .sh files in the directory
-    sh_files = list(input_dir.glob("*.sh"))
+    sh_files = sorted(iter_shell_files(input_dir))
     
     if not sh_files:
         print(f"❌ No .sh files found in directory: {input_dir}")
         return False
     
     print(f"📁 Found {len(sh_files)} .sh files to process:")
-    for file_path in sorted(sh_files):
+    for file_path in sh_files:
         print(f"   - {file_path.name}")
     
     print(f"\n🔄 Processing files...")
@@ -85,13 +120,13 @@ def process_directory(input_dir: Path, output_folder: str) -> bool:
     success_count = 0
     failed_files = []
     
-    for file_path in sorted(sh_files):
-        print(f"\n📄 Processing: {file_path.name}")
-        extractor = SQLExtractor(str(file_path), output_folder)
-        if extractor.extract():
+    # Each file is independent, so they can be extracted in parallel
+    for file_path, success in _extract_files(sh_files, output_folder):
+        if success:
             success_count += 1
         else:
             failed_files.append(file_path.name)
+    failed_files.sort()
     
     # Summary
     print(f"\n📊 Processing Summary:")
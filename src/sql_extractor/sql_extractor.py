@@ -8,10 +8,75 @@ It can handle various SQL statement types including SELECT, INSERT, UPDATE, DELE
 
 import os
 import re
+import mmap
 import argparse
 import logging
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
+
+
+# BTEQ blocks look like: bteq <<EOF ... EOF. The opening and closing markers
+# are matched separately so a block is found in one forward scan, without
+# a lazy .*? that has to retry the terminator at every character
+_BTEQ_OPEN_RE = re.compile(r'bteq\s*<<EOF(\s*)\n', re.IGNORECASE)
+# In a bytes pattern \s only matches ASCII whitespace, so the mmap scan
+# spells out the UTF-8 encoding of every character str's \s matches
+_UTF8_SPACE = (rb'(?:[\t-\r\x1c- ]|\xc2[\x85\xa0]|\xe1\x9a\x80'
+               rb'|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80)')
+_BTEQ_OPEN_BYTES_RE = re.compile(
+    rb'bteq' + _UTF8_SPACE + rb'*<<EOF(' + _UTF8_SPACE + rb'*)\n', re.IGNORECASE)
+_BTEQ_CLOSE_RE = re.compile(r'\nEOF', re.IGNORECASE)
+_BTEQ_CLOSE_BYTES_RE = re.compile(rb'\nEOF', re.IGNORECASE)
+
+# Files at least this large are scanned through mmap instead of being read
+# into memory; only the matched BTEQ blocks are decoded
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Block comments /* ... */
+_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+# BTEQ commands that don't need a dot prefix, followed by a space, a
+# semicolon or the end of the line
+_BTEQ_NO_DOT_COMMAND_RE = re.compile(r'(?:BT|ET|SLEEP)(?:[ ;]|$)')
+
+# BTEQ commands that need a dot prefix. They are matched as a prefix of the
+# line, so forms like ".EXIT(8)" or ".QUIT," count as commands too. Longer
+# commands such as .ECHOREQ or .SKIPLINE are covered by their prefix.
+_BTEQ_DOT_COMMANDS = (
+    '.ABORT', '.ACCOUNT', '.AUTOCONNECT', '.AUTODISCONNECT', '.AUTOLOGON',
+    '.BEGQUERY', '.BREAK', '.BT', '.CHECKPOINT', '.CLOSE', '.CONNECT',
+    '.CONTINUE', '.DATABASE', '.DEFAULTS', '.DISCARD', '.DISCONNECT',
+    '.DISTRIBUTION', '.DUMP', '.ECHO', '.ENDQUERY', '.ERRORCODE',
+    '.ERRORLEVEL', '.ERROROUT', '.ET', '.EXIT', '.EXPORT', '.FORMAT',
+    '.GOTO', '.HELP', '.IF', '.IMPORT', '.INDICDATA', '.LABEL', '.LAST',
+    '.LOGOFF', '.LOGON', '.LOGMECH', '.MACRO', '.MESSAGE', '.NONSTOP',
+    '.NULL', '.PACK', '.PASSWORD', '.PRINT', '.QUERY', '.QUIET', '.QUIT',
+    '.RECORD', '.REPEAT', '.RESET', '.RETRY', '.RETURN', '.RUN', '.SAMPLE',
+    '.SESSIONS', '.SET', '.SEVERITY', '.SHOW', '.SID', '.SKIP', '.SLEEP',
+    '.SPOOL', '.TDP', '.TERM', '.TIMEOUT', '.TITLE', '.UNPACK', '.WIDTH',
+    '.ZERO',
+)
+
+# Keyword a SQL statement starts with and the statement type it maps to.
+# Keywords are 4 to 6 characters long and none is a prefix of another.
+_STATEMENT_TYPES = {
+    'SELECT': 'SELECT',
+    'INSERT': 'INSERT',
+    'UPDATE': 'UPDATE',
+    'DELETE': 'DELETE',
+    'CREATE': 'CREATE',
+    'DROP': 'DROP',
+    'ALTER': 'ALTER',
+    'MERGE': 'MERGE',
+    'WITH': 'CTE',
+}
+
+
+def _count_newlines(content: Union[str, bytes, mmap.mmap], newline, start: int, end: int) -> int:
+    """Count newlines in content[start:end]; mmap has no count(), so only that span is copied"""
+    if isinstance(content, mmap.mmap):
+        return content[start:end].count(newline)
+    return content.count(newline, start, end)
 
 
 class SQLExtractor:
@@ -77,29 +142,80 @@ class SQLExtractor:
             self.logger.error(f"Error reading file {self.input_file}: {e}")
             raise
             
-    def extract_bteq_blocks(self, content: str) -> List[Tuple[str, int, int]]:
+    def read_bteq_blocks(self) -> List[Tuple[str, int, int]]:
+        """
+        Read the input file and extract its BTEQ blocks.
+        
+        Large files are memory-mapped and scanned as bytes, so the whole
+        script is never decoded into a string. Files containing carriage
+        returns are read as text instead, for its newline translation.
+        
+        Returns:
+            List of tuples containing (sql_block, start_line, end_line)
+        """
+        if self.input_file.stat().st_size < _MMAP_THRESHOLD:
+            return self.extract_bteq_blocks(self.read_file_content())
+        
+        try:
+            with open(self.input_file, 'rb') as file, \
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                if buffer.find(b'\r') != -1:
+                    return self.extract_bteq_blocks(self.read_file_content())
+                self.logger.info(f"Successfully mapped file: {self.input_file}")
+                return self.extract_bteq_blocks(buffer)
+        except Exception as e:
+            self.logger.error(f"Error reading file {self.input_file}: {e}")
+            raise
+            
+    def extract_bteq_blocks(self, content: Union[str, bytes, mmap.mmap]) -> List[Tuple[str, int, int]]:
         """
         Extract BTEQ blocks from the shell script content.
         
         Args:
-            content: The shell script content
+            content: The shell script content, either as a string or as a
+                UTF-8 encoded buffer (bytes or mmap)
             
         Returns:
             List of tuples containing (sql_block, start_line, end_line)
         """
         bteq_blocks = []
         
-        # Pattern to match BTEQ blocks: bteq <<EOF ... EOF
-        # This handles both single-line and multi-line BTEQ blocks
-        bteq_pattern = r'bteq\s*<<EOF\s*\n(.*?)\nEOF'
-        
-        matches = re.finditer(bteq_pattern, content, re.DOTALL | re.IGNORECASE)
-        
-        for match in matches:
-            sql_block = match.group(1).strip()
-            start_line = content[:match.start()].count('\n') + 1
-            end_line = content[:match.end()].count('\n') + 1
+        if isinstance(content, str):
+            open_re, close_re, newline = _BTEQ_OPEN_RE, _BTEQ_CLOSE_RE, '\n'
+        else:
+            open_re, close_re, newline = _BTEQ_OPEN_BYTES_RE, _BTEQ_CLOSE_BYTES_RE, b'\n'
+        
+        # Line numbers are counted incrementally between matches, so each
+        # stretch of the file is counted once
+        line = 1
+        counted_to = 0
+        
+        pos = 0
+        while True:
+            opening = open_re.search(content, pos)
+            if opening is None:
+                break
+            closing = close_re.search(content, opening.end())
+            if closing is None:
+                # An empty block can still close on the last blank line
+                # after <<EOF (e.g. "<<EOF\n\nEOF")
+                if newline in opening.group(1):
+                    closing = close_re.match(content, opening.end() - 1)
+                if closing is None:
+                    # Unterminated block; no later block can be closed either
+                    break
+            
+            sql_block = content[opening.end():closing.start()]
+            if not isinstance(sql_block, str):
+                sql_block = sql_block.decode('utf-8')
+            sql_block = sql_block.strip()
+            line += _count_newlines(content, newline, counted_to, opening.start())
+            start_line = line
+            line += _count_newlines(content, newline, opening.start(), closing.end())
+            end_line = line
+            counted_to = closing.end()
             bteq_blocks.append((sql_block, start_line, end_line))
+            pos = closing.end()
             
         self.logger.info(f"Found {len(bteq_blocks)} BTEQ blocks")
         return bteq_blocks
@@ -115,7 +231,7 @@ class SQLExtractor:
             Text with comments removed
         """
         # Remove block comments /* ... */ - replace with empty string
-        text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
+        text = _BLOCK_COMMENT_RE.sub('', text)
         
         # Remove line comments --
         lines = text.split('\n')
@@ -144,44 +260,9 @@ class SQLExtractor:
         Returns:
             True if the line is a BTEQ command, False otherwise
         """
-        # BTEQ commands that don't need dot prefix
-        bteq_commands_no_dot = [
-            'BT', 'ET', 'SLEEP'
-        ]
-        
-        # Check for commands without dot prefix first (with or without semicolon)
-        for cmd in bteq_commands_no_dot:
-            if (line_upper == cmd or 
-                line_upper == cmd + ';' or 
-                line_upper.startswith(cmd + ' ') or
-                line_upper.startswith(cmd + ';')):
-                return True
-        
-        # BTEQ commands that require dot prefix
-        if not line.startswith('.'):
-            return False
-            
-        # Comprehensive list of BTEQ commands with dot prefix (case insensitive)
-        bteq_commands_with_dot = [
-            '.ABORT', '.ACCOUNT', '.AUTOCONNECT', '.AUTODISCONNECT', '.AUTOLOGON',
-            '.BEGQUERY', '.BREAK', '.BT', '.CHECKPOINT', '.CLOSE', '.CONNECT',
-            '.CONTINUE', '.DATABASE', '.DEFAULTS', '.DISCARD', '.DISCONNECT',
-            '.DISTRIBUTION', '.DUMP', '.ECHO', '.ENDQUERY', '.ERRORCODE', '.ERRORLEVEL',
-            '.ERROROUT', '.ET', '.EXIT', '.EXPORT', '.FORMAT', '.GOTO', '.HELP',
-            '.IF', '.IMPORT', '.INDICDATA', '.LABEL', '.LAST', '.LOGOFF', '.LOGON',
-            '.LOGMECH', '.MACRO', '.MESSAGE', '.NONSTOP', '.NULL', '.PACK', '.PACKET',
-            '.PASSWORD', '.PRINT', '.QUERY', '.QUIET', '.QUIT', '.RECORD', '.REPEAT',
-            '.REPEATMODE', '.RESET', '.RETRY', '.RETURN', '.RUN', '.RUNFILE', '.SAMPLE',
-            '.SESSIONS', '.SET', '.SEVERITY', '.SHOW', '.SID', '.SKIP', '.SLEEP', '.SPOOL',
-            '.TDP', '.TERM', '.TIMEOUT', '.TITLE', '.UNPACK', '.WIDTH', '.ZERO'
-        ]
-        
-        # Check if line starts with any BTEQ command with dot prefix
-        for cmd in bteq_commands_with_dot:
-            if line_upper.startswith(cmd):
-                return True
-                
-        return False
+        if line.startswith('.'):
+            return line_upper.startswith(_BTEQ_DOT_COMMANDS)
+        return _BTEQ_NO_DOT_COMMAND_RE.match(line_upper) is not None
         
     def extract_individual_sql_statements(self, bteq_block: str, start_line: int, end_line: int) -> List[Tuple[str, str, int]]:
         """
@@ -208,9 +289,8 @@ class SQLExtractor:
             line = line.strip()
             line_upper = line.upper()
             
-            # Skip BTEQ commands (case insensitive)
-            if (self._is_bteq_command(line, line_upper) or
-                line == ''):
+            # Skip empty lines and BTEQ commands (case insensitive)
+            if line == '' or self._is_bteq_command(line, line_upper):
                 continue
             cleaned_lines.append(line)
             
@@ -249,28 +329,11 @@ class SQLExtractor:
         Returns:
             Statement type (SELECT, INSERT, UPDATE, DELETE, etc.)
         """
-        statement_upper = statement.upper().strip()
-        
-        if statement_upper.startswith('SELECT'):
-            return 'SELECT'
-        elif statement_upper.startswith('INSERT'):
-            return 'INSERT'
-        elif statement_upper.startswith('UPDATE'):
-            return 'UPDATE'
-        elif statement_upper.startswith('DELETE'):
-            return 'DELETE'
-        elif statement_upper.startswith('CREATE'):
-            return 'CREATE'
-        elif statement_upper.startswith('DROP'):
-            return 'DROP'
-        elif statement_upper.startswith('ALTER'):
-            return 'ALTER'
-        elif statement_upper.startswith('MERGE'):
-            return 'MERGE'
-        elif statement_upper.startswith('WITH'):
-            return 'CTE'
-        else:
-            return 'OTHER'
+        # The statement only has to start with a keyword, so just the first
+        # six characters are uppercased and looked up at each keyword length
+        head = statement.lstrip()[:6].upper()
+        return (_STATEMENT_TYPES.get(head) or _STATEMENT_TYPES.get(head[:5])
+                or _STATEMENT_TYPES.get(head[:4], 'OTHER'))
             
     def write_single_sql_file(self, sql_statements: List[Tuple[str, str, int]], 
                              base_filename: str) -> None:
@@ -307,8 +370,7 @@ class SQLExtractor:
             if not self.validate_inputs():
                 return False
                 
-            content = self.read_file_content()
-            bteq_blocks = self.extract_bteq_blocks(content)
+            bteq_blocks = self.read_bteq_blocks()
             
             if not bteq_blocks:
                 self.logger.warning("No BTEQ blocks found in the file")
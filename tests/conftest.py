@@ -0,0 +1,31 @@
+"""
+Shared fixtures for the test suite
+"""
+
+import pytest
+from src.lineage_analyzer.lineage import ETLLineageAnalyzerSQLGlot
+from src.lineage_analyzer.sqlglot_parser import SQLGlotParser
+
+
+@pytest.fixture(scope="session")
+def analyzer():
+    """Teradata analyzer shared by the whole test session"""
+    return ETLLineageAnalyzerSQLGlot()
+
+
+@pytest.fixture(scope="session")
+def spark_analyzer():
+    """Spark analyzer shared by the whole test session"""
+    return ETLLineageAnalyzerSQLGlot(dialect="spark")
+
+
+@pytest.fixture(scope="session")
+def spark2_analyzer():
+    """Spark2 analyzer shared by the whole test session"""
+    return ETLLineageAnalyzerSQLGlot(dialect="spark2")
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """Teradata SQLGlot parser shared by the whole test session"""
+    return SQLGlotParser()
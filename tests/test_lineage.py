@@ -3,71 +3,115 @@ Tests for the ETL Lineage Analyzer
 """
 
 import pytest
-import tempfile
-import os
 import json
-from pathlib import Path
+import textwrap
+from unittest.mock import patch
+from src.lineage_analyzer import lineage
 from src.lineage_analyzer.lineage import ETLLineageAnalyzerSQLGlot, LineageInfo, TableOperation
 
 
-class TestETLLineageAnalyzer:
-    """Test cases for the ETLLineageAnalyzer class"""
+# Volatile-table ETL script shared by the basic analyzer tests
+_CANONICAL_SQL = textwrap.dedent("""
+    -- This is a SQL file
+    CREATE VOLATILE TABLE temp_table AS (
+        SELECT * FROM source_table
+    );
+
+    INSERT INTO target_table
+    SELECT * FROM temp_table;
+    """)
+
+# View over a schema-qualified table
+_VIEW_SQL = textwrap.dedent("""
+    CREATE VIEW IF NOT EXISTS BIZT.BATCHCHARACTERISTICSDATA_V AS
+    SELECT *
+    FROM BIZT.BATCHCHARACTERISTICSDATA
+    """)
+
+
+def _assert_no_case_duplicates(tables, label):
+    """Assert that no two table names differ only by case, stopping at the first clash"""
+    seen = set()
+    for table in tables:
+        key = table.lower()
+        assert key not in seen, f"Duplicate table names found in {label}: {table}"
+        seen.add(key)
+
+
+class _TaggingAnalyzer(ETLLineageAnalyzerSQLGlot):
+    """Analyzer whose JSON export carries a marker, to tell it apart from the base class"""
+
+    def to_json_dict(self, lineage_info):
+        return {**super().to_json_dict(lineage_info), "tagged": True}
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.analyzer = ETLLineageAnalyzerSQLGlot()
-        self.spark_analyzer = ETLLineageAnalyzerSQLGlot(dialect="spark")
-        self.spark2_analyzer = ETLLineageAnalyzerSQLGlot(dialect="spark2")
 
+class TestETLLineageAnalyzer:
+    """Test cases for the ETLLineageAnalyzer class"""
 
-    def test_extract_sql_blocks_from_sql_file(self):
+    def test_extract_sql_blocks_from_sql_file(self, analyzer):
         """Test SQL block extraction from SQL files"""
-        sql_content = """
-        -- This is a SQL file
-        CREATE VOLATILE TABLE temp_table AS (
-            SELECT * FROM source_table
-        );
-        
-        INSERT INTO target_table
-        SELECT * FROM temp_table;
-        """
-        
-        blocks = self.analyzer.extract_sql_blocks(sql_content)
+        blocks = analyzer.extract_sql_blocks(_CANONICAL_SQL)
         assert len(blocks) == 1
         assert "CREATE VOLATILE TABLE" in blocks[0]
         assert "INSERT INTO target_table" in blocks[0]
 
+    def test_extract_sql_blocks_from_bytes(self, analyzer):
+        """Test SQL block extraction from raw file bytes"""
+        assert analyzer.extract_sql_blocks(b"  \r\n\t\n") == []
 
-    def test_analyze_script_with_temp_file(self):
+        blocks = analyzer.extract_sql_blocks(b"SELECT 1;\r\nSELECT 2;\r\n")
+        assert blocks == ["SELECT 1;\nSELECT 2;\n"]
+
+
+    def test_analyze_script_with_temp_file(self, analyzer, tmp_path):
         """Test script analysis with a temporary file"""
-        sql_content = """
-        CREATE VOLATILE TABLE temp_table AS (
-            SELECT * FROM source_table
-        );
+        temp_file = tmp_path / "test.sql"
+        temp_file.write_text(_CANONICAL_SQL)
         
-        INSERT INTO target_table
-        SELECT * FROM temp_table;
-        """
+        lineage_info = analyzer.analyze_script(str(temp_file))
+        
+        assert isinstance(lineage_info, LineageInfo)
+        assert lineage_info.script_name == temp_file.name
+        # The analyzer correctly identifies temp_table as a source table
+        # since it's created from source_table in the CREATE VOLATILE statement
+        assert "TEMP_TABLE" in lineage_info.source_tables
+        assert "TARGET_TABLE" in lineage_info.target_tables
+        assert "TEMP_TABLE" in lineage_info.volatile_tables
+
+    def test_analyze_sql_matches_analyze_script(self, analyzer, tmp_path):
+        """Test that in-memory analysis matches analyzing the same file"""
+        temp_file = tmp_path / "test.sql"
+        temp_file.write_text(_CANONICAL_SQL)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-            f.write(sql_content)
-            temp_file = f.name
-        
-        try:
-            lineage_info = self.analyzer.analyze_script(temp_file)
-            
-            assert isinstance(lineage_info, LineageInfo)
-            assert lineage_info.script_name == os.path.basename(temp_file)
-            # The analyzer correctly identifies temp_table as a source table
-            # since it's created from source_table in the CREATE VOLATILE statement
-            assert "TEMP_TABLE" in lineage_info.source_tables
-            assert "TARGET_TABLE" in lineage_info.target_tables
-            assert "TEMP_TABLE" in lineage_info.volatile_tables
-            
-        finally:
-            os.unlink(temp_file)
-
-    def test_export_to_json_new_format(self):
+        assert analyzer.analyze_sql(_CANONICAL_SQL, "test.sql") == analyzer.analyze_script(str(temp_file))
+        
+        with pytest.raises(ValueError, match="No SQL content found"):
+            analyzer.analyze_sql("  \n", "empty.sql")
+
+    def test_read_sql_blocks_normalizes_newlines(self, analyzer, tmp_path):
+        """Test that CRLF and CR line endings read as LF"""
+        temp_file = tmp_path / "test.sql"
+        temp_file.write_bytes(b"SELECT 1;\r\nSELECT 2;\rSELECT 3;\n")
+
+        blocks = analyzer._read_sql_blocks(temp_file)
+        assert blocks == ["SELECT 1;\nSELECT 2;\nSELECT 3;\n"]
+
+    def test_analyze_script_large_file_uses_mmap(self, analyzer, tmp_path):
+        """Test that large scripts are memory-mapped and read like text files"""
+        sql_content = "INSERT INTO target_table\r\nSELECT * FROM source_table;\r\n"
+
+        temp_file = tmp_path / "test.sql"
+        temp_file.write_bytes(sql_content.encode('utf-8'))
+
+        with patch('src.lineage_analyzer.lineage._MMAP_THRESHOLD', 0):
+            blocks = analyzer._read_sql_blocks(temp_file)
+            lineage_info = analyzer.analyze_script(str(temp_file))
+
+        assert blocks == ["INSERT INTO target_table\nSELECT * FROM source_table;\n"]
+        assert "SOURCE_TABLE" in lineage_info.source_tables
+        assert "TARGET_TABLE" in lineage_info.target_tables
+
+    def test_export_to_json_new_format(self, analyzer):
         """Test JSON export functionality with new format"""
         # Create a mock lineage info with operations
         operations = [
@@ -101,60 +145,122 @@ class TestETLLineageAnalyzer:
             warnings=[]
         )
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_file = f.name
-        
-        try:
-            self.analyzer.export_to_json(lineage_info, temp_file)
-            
-            # Verify file was created and contains expected content
-            assert os.path.exists(temp_file)
-            with open(temp_file, 'r') as f:
-                data = json.load(f)
-                
-                # Check new JSON structure
-                assert "script_name" in data
-                assert "bteq_statements" in data
-                assert "tables" in data
-                
-                # Check script name
-                assert data["script_name"] == "test.sql"
-                
-                # Check bteq_statements array
-                assert isinstance(data["bteq_statements"], list)
-                assert len(data["bteq_statements"]) > 0
-                
-                # Check tables structure
-                assert isinstance(data["tables"], dict)
-                assert "temp_table" in data["tables"]
-                assert "target_table" in data["tables"]
-                
-                # Check table structure
-                temp_table_data = data["tables"]["temp_table"]
-                assert "source" in temp_table_data
-                assert "target" in temp_table_data
-                assert "is_volatile" in temp_table_data
-                assert temp_table_data["is_volatile"] == True
-                
-        finally:
-            os.unlink(temp_file)
-
-
-
-
-
-    def test_extract_operations(self):
-        """Test operation extraction from SQL"""
-        sql = """
-        CREATE VOLATILE TABLE temp_table AS (
-            SELECT * FROM source_table
-        );
+        data = analyzer.to_json_dict(lineage_info)
         
-        INSERT INTO target_table
-        SELECT * FROM temp_table;
-        """
+        # Check new JSON structure
+        assert "script_name" in data
+        assert "bteq_statements" in data
+        assert "tables" in data
+        
+        # Check script name
+        assert data["script_name"] == "test.sql"
+        
+        # Check bteq_statements array
+        assert isinstance(data["bteq_statements"], list)
+        assert len(data["bteq_statements"]) > 0
+        
+        # Check tables structure
+        assert isinstance(data["tables"], dict)
+        assert "temp_table" in data["tables"]
+        assert "target_table" in data["tables"]
+        assert list(data["tables"]) == ["source_table", "target_table", "temp_table"]
+        
+        # Check table structure
+        temp_table_data = data["tables"]["temp_table"]
+        assert "source" in temp_table_data
+        assert "target" in temp_table_data
+        assert "is_volatile" in temp_table_data
+        assert temp_table_data["is_volatile"] == True
+
+    def test_export_to_json_writes_file(self, analyzer, tmp_path):
+        """Test that export_to_json writes the JSON structure to disk"""
+        lineage_info = LineageInfo(
+            script_name="test.sql",
+            volatile_tables=[],
+            source_tables={"source_table"},
+            target_tables={"target_table"},
+            operations=[
+                TableOperation("INSERT", "target_table", ["source_table"], [], [], 1,
+                               "INSERT INTO target_table SELECT * FROM source_table;")
+            ],
+            table_relationships={"target_table": ["source_table"]},
+            warnings=[]
+        )
+        temp_file = tmp_path / "test.json"
+        
+        analyzer.export_to_json(lineage_info, str(temp_file))
+        
+        assert json.loads(temp_file.read_text()) == analyzer.to_json_dict(lineage_info)
+
+    def test_to_json_dict_has_no_output(self, analyzer, tmp_path, capsys):
+        """Test that only export_to_json warns about a script without statements"""
+        lineage_info = LineageInfo(
+            script_name="empty.sql",
+            volatile_tables=[],
+            source_tables=set(),
+            target_tables=set(),
+            operations=[],
+            table_relationships={},
+            warnings=[]
+        )
         
-        operations = self.analyzer.extract_operations(sql)
+        assert analyzer.to_json_dict(lineage_info)["bteq_statements"] == []
+        assert capsys.readouterr().out == ""
+        
+        analyzer.export_to_json(lineage_info, str(tmp_path / "empty.json"))
+        
+        assert "No BTEQ statements found in empty.sql" in capsys.readouterr().out
+
+    def test_dump_json_matches_stdlib(self):
+        """Test that the orjson fast path produces the same output as the json fallback"""
+        data = {
+            "script_name": "test.sql",
+            "bteq_statements": ["SELECT 1;"],
+            "tables": {"A": {"source": [], "target": [{"name": "B", "operation": [0]}]}},
+            "warnings": [],
+        }
+
+        with patch.object(lineage, 'orjson', None):
+            fallback = lineage._dump_json(data)
+            non_ascii = lineage._dump_json({"script_name": "café.sql"})
+
+        assert fallback == json.dumps(data, indent=2).encode("utf-8")
+        # Like the stdlib default, the fallback escapes non-ASCII characters
+        assert non_ascii == b'{\n  "script_name": "caf\\u00e9.sql"\n}'
+        if lineage.orjson is not None:
+            assert lineage._dump_json(data) == fallback
+
+    def test_export_to_json_formats_each_statement_once(self, analyzer, capsys):
+        """Test that export_to_json reuses formatted statements"""
+        statement = "INSERT INTO target_table SELECT * FROM source_table;"
+        operations = [
+            TableOperation("INSERT", "target_table", ["source_table"], [], [], line, statement)
+            for line in (1, 2, 3)
+        ]
+        lineage_info = LineageInfo(
+            script_name="test.sql",
+            volatile_tables=[],
+            source_tables={"source_table"},
+            target_tables={"target_table"},
+            operations=operations,
+            table_relationships={"target_table": ["source_table"]},
+            warnings=[]
+        )
+
+        lineage._format_sql_statement.cache_clear()
+        analyzer.export_to_json(lineage_info)
+
+        assert lineage._format_sql_statement.cache_info().misses == 1
+        data = json.loads(capsys.readouterr().out)
+        assert len(data["bteq_statements"]) == 1
+
+
+
+
+
+    def test_extract_operations(self, analyzer):
+        """Test operation extraction from SQL"""
+        operations = analyzer.extract_operations(_CANONICAL_SQL)
         
         assert len(operations) == 2
         
@@ -170,119 +276,161 @@ class TestETLLineageAnalyzer:
         assert insert_op.target_table == "TARGET_TABLE"
         assert "TEMP_TABLE" in insert_op.source_tables
 
-    def test_process_folder(self):
+    def test_split_sql_statements_with_offsets(self, analyzer):
+        """Test statement splitting ignores semicolons inside parentheses"""
+        sql = "INSERT INTO t1 SELECT * FROM (SELECT 1; ) x;\nDELETE FROM t2;  SELECT 3"
+
+        statements = analyzer._split_sql_statements_with_offsets(sql)
+
+        assert statements == [
+            ("INSERT INTO t1 SELECT * FROM (SELECT 1; ) x;", 0),
+            ("DELETE FROM t2;", 44),
+            ("SELECT 3", 60),
+        ]
+
+    def test_extract_operations_reuses_parse_cache(self):
+        """Test that repeated statements are parsed once and keep their own line numbers"""
+        # Fresh analyzer: the shared one may already have these statements cached
+        analyzer = ETLLineageAnalyzerSQLGlot()
+        sql = """
+        INSERT INTO target_table SELECT * FROM source_table;
+        INSERT INTO target_table SELECT * FROM source_table;
+        """
+
+        with patch.object(analyzer.parser, 'parse_sql_statement',
+                          wraps=analyzer.parser.parse_sql_statement) as parse:
+            operations = analyzer.extract_operations(sql)
+
+        assert parse.call_count == 1
+        assert len(operations) == 2
+        assert operations[0].line_number != operations[1].line_number
+        assert operations[0].source_tables is not operations[1].source_tables
+
+    def test_process_folder(self, analyzer, tmp_path):
         """Test folder processing functionality"""
-        # Create a temporary directory with test files
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test SQL file
-            test_sql = os.path.join(temp_dir, "test.sql")
-            with open(test_sql, 'w') as f:
-                f.write("""
-                CREATE VOLATILE TABLE temp_table AS (
-                    SELECT * FROM source_table
-                );
-                
-                INSERT INTO target_table
-                SELECT * FROM temp_table;
-                """)
-            
-            # Create output directory
-            output_dir = os.path.join(temp_dir, "output")
-            os.makedirs(output_dir)
-            
-            # Process the folder
-            self.analyzer.process_folder(temp_dir, output_dir)
-            
-                        # Check that output files were created
-            expected_files = [
-                "test_sql_lineage.json",
-                "test.bteq"
-            ]
-
-            for filename in expected_files:
-                filepath = os.path.join(output_dir, filename)
-                assert os.path.exists(filepath), f"Expected file {filename} was not created"
-
-    def test_create_view_handling(self):
+        # Create test SQL file
+        test_sql = tmp_path / "test.sql"
+        test_sql.write_text(_CANONICAL_SQL)
+        
+        # process_folder creates the output directory itself
+        output_dir = tmp_path / "output"
+        
+        # Process the folder
+        analyzer.process_folder(str(tmp_path), str(output_dir))
+        
+        # Check that output files were created
+        expected_files = [
+            "test_sql_lineage.json",
+            "test.bteq"
+        ]
+
+        for filename in expected_files:
+            filepath = output_dir / filename
+            assert filepath.exists(), f"Expected file {filename} was not created"
+
+    def test_process_folder_multiple_files(self, analyzer, tmp_path, capsys):
+        """Test that parallel folder processing reports every file, including failures"""
+        for i in range(3):
+            (tmp_path / f"script_{i}.sql").write_text(f"INSERT INTO target_{i} SELECT * FROM source_{i};\n")
+        (tmp_path / "empty.sql").write_text("\n")
+
+        output_dir = tmp_path / "output"
+        analyzer.process_folder(str(tmp_path), str(output_dir), max_workers=2)
+
+        # Worker output is printed by the parent, grouped per file and in file order
+        output = capsys.readouterr().out
+        positions = [output.index(f"Processing: {name}")
+                     for name in ("empty.sql", "script_0.sql", "script_1.sql", "script_2.sql")]
+        assert positions == sorted(positions)
+        exported = output.index("Lineage data exported to: " + str(output_dir / "script_0_sql_lineage.json"))
+        assert positions[1] < exported < positions[2]
+
+        for i in range(3):
+            assert (output_dir / f"script_{i}_sql_lineage.json").exists()
+
+        summary = (output_dir / "processing_summary.yaml").read_text()
+        assert "successfully_processed: 3" in summary
+        assert "failed_to_process: 1" in summary
+        assert "file: empty.sql" in summary
+
+    def test_process_folder_uses_calling_analyzer(self, tmp_path):
+        """Test that worker processes run the analyzer process_folder was called on"""
+        for i in range(lineage._MIN_PARALLEL_SCRIPTS):
+            (tmp_path / f"script_{i}.sql").write_text(f"INSERT INTO target_{i} SELECT * FROM source_{i};\n")
+
+        output_dir = tmp_path / "output"
+        _TaggingAnalyzer().process_folder(str(tmp_path), str(output_dir), max_workers=2)
+
+        data = json.loads((output_dir / "script_0_sql_lineage.json").read_text())
+        assert data["tagged"] is True
+
+    def test_process_folder_defaults_to_in_process(self, analyzer, tmp_path):
+        """Test that process_folder starts no worker processes unless asked to"""
+        for i in range(lineage._MIN_PARALLEL_SCRIPTS):
+            (tmp_path / f"script_{i}.sql").write_text(f"INSERT INTO target_{i} SELECT * FROM source_{i};\n")
+
+        output_dir = tmp_path / "output"
+        with patch.object(lineage, "ProcessPoolExecutor") as pool:
+            analyzer.process_folder(str(tmp_path), str(output_dir))
+
+        pool.assert_not_called()
+        summary = (output_dir / "processing_summary.yaml").read_text()
+        assert f"successfully_processed: {lineage._MIN_PARALLEL_SCRIPTS}" in summary
+
+    def test_create_view_handling(self, analyzer):
         """Test CREATE VIEW statement handling"""
-        sql_content = """
-        CREATE VIEW IF NOT EXISTS BIZT.BATCHCHARACTERISTICSDATA_V AS
-        SELECT *
-        FROM BIZT.BATCHCHARACTERISTICSDATA
-        """
+        lineage_info = analyzer.analyze_sql(_VIEW_SQL, "test.sql")
+        
+        assert isinstance(lineage_info, LineageInfo)
+        assert lineage_info.script_name == "test.sql"
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-            f.write(sql_content)
-            temp_file = f.name
-        
-        try:
-            lineage_info = self.analyzer.analyze_script(temp_file)
-            
-            assert isinstance(lineage_info, LineageInfo)
-            assert lineage_info.script_name == os.path.basename(temp_file)
-            
-            # Check that the view is identified as a target table
-            assert "BIZT.BATCHCHARACTERISTICSDATA_V" in lineage_info.target_tables
-            
-            # Check that the source table is identified
-            assert "BIZT.BATCHCHARACTERISTICSDATA" in lineage_info.source_tables
-            
-            # Check that there's one operation
-            assert len(lineage_info.operations) == 1
-            operation = lineage_info.operations[0]
-            assert operation.operation_type == "CREATE_VIEW"
-            assert operation.target_table == "BIZT.BATCHCHARACTERISTICSDATA_V"
-            assert "BIZT.BATCHCHARACTERISTICSDATA" in operation.source_tables
-            
-            # Check table relationships
-            assert "BIZT.BATCHCHARACTERISTICSDATA_V" in lineage_info.table_relationships
-            assert "BIZT.BATCHCHARACTERISTICSDATA" in lineage_info.table_relationships["BIZT.BATCHCHARACTERISTICSDATA_V"]
-            
-        finally:
-            os.unlink(temp_file)
-
-    def test_create_view_variations(self):
+        # Check that the view is identified as a target table
+        assert "BIZT.BATCHCHARACTERISTICSDATA_V" in lineage_info.target_tables
+        
+        # Check that the source table is identified
+        assert "BIZT.BATCHCHARACTERISTICSDATA" in lineage_info.source_tables
+        
+        # Check that there's one operation
+        assert len(lineage_info.operations) == 1
+        operation = lineage_info.operations[0]
+        assert operation.operation_type == "CREATE_VIEW"
+        assert operation.target_table == "BIZT.BATCHCHARACTERISTICSDATA_V"
+        assert "BIZT.BATCHCHARACTERISTICSDATA" in operation.source_tables
+        
+        # Check table relationships
+        assert "BIZT.BATCHCHARACTERISTICSDATA_V" in lineage_info.table_relationships
+        assert "BIZT.BATCHCHARACTERISTICSDATA" in lineage_info.table_relationships["BIZT.BATCHCHARACTERISTICSDATA_V"]
+
+    @pytest.mark.parametrize("sql_content,expected_target,expected_sources", [
+        # Standard CREATE VIEW
+        ("CREATE VIEW schema.view_name AS SELECT * FROM table1", "SCHEMA.VIEW_NAME", ["TABLE1"]),
+        # CREATE VIEW with IF NOT EXISTS
+        ("CREATE VIEW IF NOT EXISTS view_name AS SELECT * FROM table1", "VIEW_NAME", ["TABLE1"]),
+        # CREATE VIEW with schema and IF NOT EXISTS
+        ("CREATE VIEW IF NOT EXISTS schema.view_name AS SELECT * FROM schema.table1", "SCHEMA.VIEW_NAME", ["SCHEMA.TABLE1"]),
+        # CREATE VIEW with multiple source tables
+        ("CREATE VIEW view_name AS SELECT * FROM table1 JOIN table2 ON table1.id = table2.id", "VIEW_NAME", ["TABLE1", "TABLE2"]),
+    ])
+    def test_create_view_variations(self, analyzer, sql_content, expected_target, expected_sources):
         """Test different CREATE VIEW statement variations"""
-        test_cases = [
-            # Standard CREATE VIEW
-            ("CREATE VIEW schema.view_name AS SELECT * FROM table1", "SCHEMA.VIEW_NAME", ["TABLE1"]),
-            # CREATE VIEW with IF NOT EXISTS
-            ("CREATE VIEW IF NOT EXISTS view_name AS SELECT * FROM table1", "VIEW_NAME", ["TABLE1"]),
-            # CREATE VIEW with schema and IF NOT EXISTS
-            ("CREATE VIEW IF NOT EXISTS schema.view_name AS SELECT * FROM schema.table1", "SCHEMA.VIEW_NAME", ["SCHEMA.TABLE1"]),
-            # CREATE VIEW with multiple source tables
-            ("CREATE VIEW view_name AS SELECT * FROM table1 JOIN table2 ON table1.id = table2.id", "VIEW_NAME", ["TABLE1", "TABLE2"]),
-        ]
+        lineage_info = analyzer.analyze_sql(sql_content, "test.sql")
+        
+        # Check that the view is identified as a target table
+        assert expected_target in lineage_info.target_tables
+        
+        # Check that all source tables are identified
+        assert set(expected_sources) <= lineage_info.source_tables
         
-        for sql_content, expected_target, expected_sources in test_cases:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-                f.write(sql_content)
-                temp_file = f.name
-            
-            try:
-                lineage_info = self.analyzer.analyze_script(temp_file)
-                
-                # Check that the view is identified as a target table
-                assert expected_target in lineage_info.target_tables
-                
-                # Check that all source tables are identified
-                for source in expected_sources:
-                    assert source in lineage_info.source_tables
-                
-                # Check that there's one operation
-                assert len(lineage_info.operations) == 1
-                operation = lineage_info.operations[0]
-                assert operation.operation_type == "CREATE_VIEW"
-                assert operation.target_table == expected_target
-                
-                # Check that all expected sources are in the operation
-                for source in expected_sources:
-                    assert source in operation.source_tables
-                
-            finally:
-                os.unlink(temp_file)
-
-    def test_case_insensitive_table_names(self):
+        # Check that there's one operation
+        assert len(lineage_info.operations) == 1
+        operation = lineage_info.operations[0]
+        assert operation.operation_type == "CREATE_VIEW"
+        assert operation.target_table == expected_target
+        
+        # Check that all expected sources are in the operation
+        assert set(expected_sources) <= set(operation.source_tables)
+
+    def test_case_insensitive_table_names(self, analyzer):
         """Test that table names are handled case-insensitively"""
         sql_content = """
         CREATE MULTISET VOLATILE TABLE VT_first_fab_enterprise_lot_id AS
@@ -301,55 +449,42 @@ class TestETLLineageAnalyzer:
         FROM VT_FIRST_FAB_ENTERPRISE_LOT_ID F;
         """
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-            f.write(sql_content)
-            temp_file = f.name
-        
-        try:
-            lineage_info = self.analyzer.analyze_script(temp_file)
-            
-            assert isinstance(lineage_info, LineageInfo)
-            assert lineage_info.script_name == os.path.basename(temp_file)
-            
-            # Check that table names are normalized to uppercase
-            assert "VT_FIRST_FAB_ENTERPRISE_LOT_ID" in lineage_info.target_tables
-            assert "VT_FIRST_FAB_ENTERPRISE_LOT_ID" in lineage_info.volatile_tables
-            assert "EDW.MFG_LOT_ACTV" in lineage_info.source_tables
-            assert "BIZT.PROMIS_STARTLOT_SOURCELOTLIST_V" in lineage_info.source_tables
-            assert "LOTMASTER_BASE_T.MFG_LOT_ACTV" in lineage_info.target_tables
-            
-            # Verify there are no duplicate table entries with different cases
-            target_tables_lower = {table.lower() for table in lineage_info.target_tables}
-            source_tables_lower = {table.lower() for table in lineage_info.source_tables}
-            volatile_tables_lower = {table.lower() for table in lineage_info.volatile_tables}
-            
-            # Check that we don't have duplicates (same table with different cases)
-            assert len(target_tables_lower) == len(lineage_info.target_tables), "Duplicate table names found in target_tables"
-            assert len(source_tables_lower) == len(lineage_info.source_tables), "Duplicate table names found in source_tables"
-            assert len(volatile_tables_lower) == len(lineage_info.volatile_tables), "Duplicate table names found in volatile_tables"
-            
-            # Check that the volatile table is correctly identified
-            assert "VT_FIRST_FAB_ENTERPRISE_LOT_ID" in lineage_info.volatile_tables
-            
-            # Check operations
-            assert len(lineage_info.operations) == 2
-            
-            # Check CREATE VOLATILE operation
-            create_op = lineage_info.operations[0]
-            assert create_op.operation_type == "CREATE_VOLATILE"
-            assert create_op.target_table == "VT_FIRST_FAB_ENTERPRISE_LOT_ID"
-            assert create_op.is_volatile == True
-            
-            # Check INSERT operation
-            insert_op = lineage_info.operations[1]
-            assert insert_op.operation_type == "INSERT"
-            assert insert_op.target_table == "LOTMASTER_BASE_T.MFG_LOT_ACTV"
-            assert "VT_FIRST_FAB_ENTERPRISE_LOT_ID" in insert_op.source_tables
-            
-        finally:
-            os.unlink(temp_file)
-
-    def test_table_name_normalization_with_schemas(self):
+        lineage_info = analyzer.analyze_sql(sql_content, "test.sql")
+        
+        assert isinstance(lineage_info, LineageInfo)
+        assert lineage_info.script_name == "test.sql"
+        
+        # Check that table names are normalized to uppercase
+        assert "VT_FIRST_FAB_ENTERPRISE_LOT_ID" in lineage_info.target_tables
+        assert "VT_FIRST_FAB_ENTERPRISE_LOT_ID" in lineage_info.volatile_tables
+        assert "EDW.MFG_LOT_ACTV" in lineage_info.source_tables
+        assert "BIZT.PROMIS_STARTLOT_SOURCELOTLIST_V" in lineage_info.source_tables
+        assert "LOTMASTER_BASE_T.MFG_LOT_ACTV" in lineage_info.target_tables
+        
+        # Check that we don't have duplicates (same table with different cases)
+        _assert_no_case_duplicates(lineage_info.target_tables, "target_tables")
+        _assert_no_case_duplicates(lineage_info.source_tables, "source_tables")
+        _assert_no_case_duplicates(lineage_info.volatile_tables, "volatile_tables")
+        
+        # Check that the volatile table is correctly identified
+        assert "VT_FIRST_FAB_ENTERPRISE_LOT_ID" in lineage_info.volatile_tables
+        
+        # Check operations
+        assert len(lineage_info.operations) == 2
+        
+        # Check CREATE VOLATILE operation
+        create_op = lineage_info.operations[0]
+        assert create_op.operation_type == "CREATE_VOLATILE"
+        assert create_op.target_table == "VT_FIRST_FAB_ENTERPRISE_LOT_ID"
+        assert create_op.is_volatile == True
+        
+        # Check INSERT operation
+        insert_op = lineage_info.operations[1]
+        assert insert_op.operation_type == "INSERT"
+        assert insert_op.target_table == "LOTMASTER_BASE_T.MFG_LOT_ACTV"
+        assert "VT_FIRST_FAB_ENTERPRISE_LOT_ID" in insert_op.source_tables
+
+    def test_table_name_normalization_with_schemas(self, analyzer):
         """Test that table names with schemas are normalized correctly"""
         sql_content = """
         CREATE VOLATILE TABLE temp_table AS (
@@ -360,31 +495,22 @@ class TestETLLineageAnalyzer:
         SELECT * FROM temp_table;
         """
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-            f.write(sql_content)
-            temp_file = f.name
-        
-        try:
-            lineage_info = self.analyzer.analyze_script(temp_file)
-            
-            # Check that schema names are also normalized to uppercase
-            assert "SCHEMA1.SOURCE_TABLE" in lineage_info.source_tables
-            assert "SCHEMA2.TARGET_TABLE" in lineage_info.target_tables
-            assert "TEMP_TABLE" in lineage_info.target_tables
-            assert "TEMP_TABLE" in lineage_info.volatile_tables
-            
-            # Verify no duplicates exist
-            all_tables = list(lineage_info.source_tables) + list(lineage_info.target_tables)
-            all_tables_lower = {table.lower() for table in all_tables}
-            assert len(all_tables_lower) == len(set(all_tables)), "Duplicate table names found"
-            
-        finally:
-            os.unlink(temp_file)
-
-    def test_spark_dialect_support(self):
-        """Test that Spark dialect is properly supported"""
-        # Test Spark SQL syntax
-        spark_sql = """
+        lineage_info = analyzer.analyze_sql(sql_content, "test.sql")
+        
+        # Check that schema names are also normalized to uppercase
+        assert "SCHEMA1.SOURCE_TABLE" in lineage_info.source_tables
+        assert "SCHEMA2.TARGET_TABLE" in lineage_info.target_tables
+        assert "TEMP_TABLE" in lineage_info.target_tables
+        assert "TEMP_TABLE" in lineage_info.volatile_tables
+        
+        # Verify no duplicates exist
+        all_tables = list(lineage_info.source_tables) + list(lineage_info.target_tables)
+        all_tables_lower = {table.lower() for table in all_tables}
+        assert len(all_tables_lower) == len(set(all_tables)), "Duplicate table names found"
+
+    @pytest.mark.parametrize("dialect,create_sql,expected_target", [
+        # Spark SQL syntax
+        ("spark", """
         CREATE TABLE IF NOT EXISTS spark_table AS
         SELECT 
             col1,
@@ -392,31 +518,9 @@ class TestETLLineageAnalyzer:
             col3
         FROM source_table
         WHERE col1 > 0
-        """
-        
-        # Test with Spark dialect using temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-            f.write(spark_sql)
-            temp_file = f.name
-        
-        try:
-            lineage_info = self.spark_analyzer.analyze_script(temp_file)
-            
-            assert lineage_info is not None
-            assert len(lineage_info.operations) > 0
-            
-            # Check that the operation was parsed correctly
-            create_operation = next((op for op in lineage_info.operations if op.operation_type == "CREATE"), None)
-            assert create_operation is not None
-            assert create_operation.target_table == "SPARK_TABLE"
-            assert "SOURCE_TABLE" in create_operation.source_tables
-        finally:
-            os.unlink(temp_file)
-
-    def test_spark2_dialect_support(self):
-        """Test that Spark2 dialect is properly supported"""
-        # Test Spark2 SQL syntax
-        spark2_sql = """
+        """, "SPARK_TABLE"),
+        # Spark2 SQL syntax
+        ("spark2", """
         CREATE OR REPLACE TABLE spark2_table AS
         SELECT 
             col1,
@@ -424,26 +528,22 @@ class TestETLLineageAnalyzer:
             col3
         FROM source_table
         WHERE col1 > 0
-        """
+        """, "SPARK2_TABLE"),
+    ], ids=["spark", "spark2"])
+    def test_dialect_support(self, request, dialect, create_sql, expected_target):
+        """Test that the Spark dialects are properly supported"""
+        dialect_analyzer = request.getfixturevalue(f"{dialect}_analyzer")
+        
+        lineage_info = dialect_analyzer.analyze_sql(create_sql, "test.sql")
+        
+        assert lineage_info is not None
+        assert len(lineage_info.operations) > 0
         
-        # Test with Spark2 dialect using temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.sql', delete=False) as f:
-            f.write(spark2_sql)
-            temp_file = f.name
-        
-        try:
-            lineage_info = self.spark2_analyzer.analyze_script(temp_file)
-            
-            assert lineage_info is not None
-            assert len(lineage_info.operations) > 0
-            
-            # Check that the operation was parsed correctly
-            create_operation = next((op for op in lineage_info.operations if op.operation_type == "CREATE"), None)
-            assert create_operation is not None
-            assert create_operation.target_table == "SPARK2_TABLE"
-            assert "SOURCE_TABLE" in create_operation.source_tables
-        finally:
-            os.unlink(temp_file)
+        # Check that the operation was parsed correctly
+        create_operation = next((op for op in lineage_info.operations if op.operation_type == "CREATE"), None)
+        assert create_operation is not None
+        assert create_operation.target_table == expected_target
+        assert "SOURCE_TABLE" in create_operation.source_tables
 
     def test_invalid_dialect_raises_error(self):
         """Test that invalid dialect raises ValueError"""
@@ -471,6 +571,8 @@ class TestTableOperation:
         assert operation.source_tables == ["source_table"]
         assert operation.line_number == 10
         assert operation.sql_statement is not None
+        # Slotted dataclass: no per-instance __dict__
+        assert not hasattr(operation, "__dict__")
 
 
 class TestLineageInfo:
@@ -9,11 +9,15 @@ import shutil
 from pathlib import Path
 import sys
 import os
+import io
+from contextlib import redirect_stdout
+from unittest.mock import patch
 
 # Add the src directory to the path so we can import the module
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from sql_extractor import SQLExtractor
+from sql_extractor.extract_sql import iter_shell_files, process_directory
 
 
 class TestSQLExtractor(unittest.TestCase):
@@ -204,6 +208,149 @@ EOF
         self.assertNotIn("-- This is a comment", content)
         self.assertNotIn("/* Multi-line", content)
 
+    def test_extract_bteq_blocks_line_numbers(self):
+        """Test that BTEQ blocks report the lines they start and end on"""
+        content = (
+            "#!/bin/bash\n"
+            "echo 'first'\n"
+            "bteq <<EOF\n"
+            "SELECT 1;\n"
+            "EOF\n"
+            "echo 'second'\n"
+            "bteq <<EOF\n"
+            "SELECT 2;\n"
+            "SELECT 3;\n"
+            "EOF\n"
+        )
+
+        extractor = SQLExtractor()
+        blocks = extractor.extract_bteq_blocks(content)
+
+        self.assertEqual(blocks, [
+            ("SELECT 1;", 3, 5),
+            ("SELECT 2;\nSELECT 3;", 7, 10),
+        ])
+
+    def test_extract_bteq_blocks_from_bytes(self):
+        """Test that a UTF-8 buffer yields the same blocks as a string"""
+        content = "echo 'x'\nbteq <<EOF\nSELECT 'é' FROM t;\nEOF\n"
+
+        extractor = SQLExtractor()
+
+        self.assertEqual(
+            extractor.extract_bteq_blocks(content.encode('utf-8')),
+            extractor.extract_bteq_blocks(content),
+        )
+
+    def test_extract_bteq_blocks_unterminated(self):
+        """Test that a block without a closing EOF is ignored"""
+        content = "bteq <<EOF\nSELECT 1;\nEOF\nbteq <<EOF\nSELECT 2;\n"
+
+        extractor = SQLExtractor()
+
+        self.assertEqual(extractor.extract_bteq_blocks(content), [("SELECT 1;", 1, 3)])
+
+    def test_extract_large_file_uses_mmap(self):
+        """Test extraction through the memory-mapped path"""
+        test_script = self.temp_path / "mapped_script.sh"
+        test_script.write_text("""
+bteq <<EOF
+.logon user,pass;
+INSERT INTO target_table SELECT * FROM source_table;
+EOF
+""")
+
+        extractor = SQLExtractor(str(test_script), str(self.output_folder))
+        with patch('sql_extractor.sql_extractor._MMAP_THRESHOLD', 0), \
+                patch.object(extractor, 'read_file_content') as mock_read:
+            success = extractor.extract()
+            mock_read.assert_not_called()
+
+        self.assertTrue(success)
+        content = (self.output_folder / "mapped_script.sql").read_text()
+        self.assertIn("INSERT INTO target_table SELECT * FROM source_table;", content)
+        self.assertNotIn(".logon", content)
+
+    def test_extract_bteq_blocks_from_bytes_strips_unicode_whitespace(self):
+        """Test that a buffer block is stripped like a string block, after decoding"""
+        content = "bteq <<EOF\n\u3000SELECT 1;\u00a0\nEOF\n"
+
+        extractor = SQLExtractor()
+
+        self.assertEqual(
+            extractor.extract_bteq_blocks(content.encode('utf-8')),
+            extractor.extract_bteq_blocks(content),
+        )
+
+    def test_extract_bteq_blocks_from_bytes_unicode_whitespace_in_opener(self):
+        """Test that non-ASCII whitespace around <<EOF opens a block in a buffer too"""
+        for space in ("\u00a0", "\u3000", "\u2028", "\x85", "\x1c"):
+            content = f"bteq{space}<<EOF{space}\nSELECT 1;\nEOF\n"
+
+            extractor = SQLExtractor()
+            expected = extractor.extract_bteq_blocks(content)
+
+            self.assertEqual(expected, [("SELECT 1;", 1, 3)], repr(space))
+            self.assertEqual(
+                extractor.extract_bteq_blocks(content.encode('utf-8')), expected, repr(space))
+
+    def test_read_large_file_with_carriage_returns(self):
+        """Test that large CRLF and CR-only files yield the same blocks as small ones"""
+        content = "echo 'x'\nbteq <<EOF\nSELECT 1;\nSELECT 2;\nEOF\n"
+        expected = SQLExtractor().extract_bteq_blocks(content)
+
+        for newline in ("\r\n", "\r"):
+            test_script = self.temp_path / "mapped_script.sh"
+            test_script.write_bytes(content.replace("\n", newline).encode('utf-8'))
+
+            extractor = SQLExtractor(str(test_script), str(self.output_folder))
+            with patch('sql_extractor.sql_extractor._MMAP_THRESHOLD', 0):
+                self.assertEqual(extractor.read_bteq_blocks(), expected, repr(newline))
+
+    def test_is_bteq_command(self):
+        """Test BTEQ command detection at the start of a line"""
+        extractor = SQLExtractor()
+
+        commands = [
+            "BT;", "ET", "SLEEP 5", ".logon user,pass;", ".QUIT;",
+            ".SET ECHOREQ OFF;", ".TITLEDASHES OFF", ".IF ERRORCODE <> 0 THEN GOTO X",
+            ".EXIT(8)", ".QUIT,", ".LOGON tdpid/user,pwd",
+        ]
+        for line in commands:
+            self.assertTrue(extractor._is_bteq_command(line, line.upper()), line)
+
+        not_commands = [
+            "", "BTEQ", "ETL_TABLE", "SELECT * FROM t;", ". /home/profile", ".NOTACOMMAND",
+        ]
+        for line in not_commands:
+            self.assertFalse(extractor._is_bteq_command(line, line.upper()), line)
+
+    def test_classify_sql_statement(self):
+        """Test statement classification by leading keyword prefix"""
+        extractor = SQLExtractor()
+
+        cases = [
+            ("SELECT * FROM t", "SELECT"),
+            ("  select* from t", "SELECT"),
+            ("insert into t values (1)", "INSERT"),
+            ("UPDATE t SET a = 1", "UPDATE"),
+            ("DELETE FROM t", "DELETE"),
+            ("CREATE TABLE t (id INT)", "CREATE"),
+            ("DROP TABLE t", "DROP"),
+            ("ALTER TABLE t ADD c INT", "ALTER"),
+            ("MERGE INTO t USING s ON 1 = 1", "MERGE"),
+            ("WITH c AS (SELECT 1) SELECT * FROM c", "CTE"),
+            ("SELECTselect", "SELECT"),
+            ("SELECTINSERT", "SELECT"),
+            ("withwith", "CTE"),
+            ("DROP_TABLE_X", "DROP"),
+            ("COLLECT STATISTICS ON t", "OTHER"),
+            ("(SELECT 1)", "OTHER"),
+            ("", "OTHER"),
+        ]
+        for statement, expected in cases:
+            self.assertEqual(extractor.classify_sql_statement(statement), expected, statement)
+
 
 class TestSQLExtractorIntegration(unittest.TestCase):
     """Integration tests for SQLExtractor"""
@@ -282,5 +429,90 @@ echo "Script completed"
         self.assertNotIn("BT;", sql_content)
 
 
+
+class TestExtractSQLDirectory(unittest.TestCase):
+    """Tests for extracting every shell file in a directory"""
+    
+    SCRIPT = "bteq <<EOF\n.logon user,pass;\nSELECT * FROM {table};\nEOF\n"
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.input_dir = Path(self.temp_dir) / "input"
+        self.input_dir.mkdir()
+        self.output_folder = Path(self.temp_dir) / "output"
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir)
+    
+    def _write_script(self, name):
+        (self.input_dir / name).write_text(self.SCRIPT.format(table=Path(name).stem))
+    
+    def _process_directory(self):
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            success = process_directory(self.input_dir, str(self.output_folder))
+        return success, stdout.getvalue()
+    
+    def test_iter_shell_files(self):
+        """Test that only .sh files directly inside the directory are yielded"""
+        for name in ("b.sh", "a.sh", "notes.txt", "a.sh.bak"):
+            self._write_script(name)
+        (self.input_dir / "nested").mkdir()
+        (self.input_dir / "nested" / "c.sh").write_text("")
+        (self.input_dir / "folder.sh").mkdir()
+        
+        files = list(iter_shell_files(self.input_dir))
+        
+        self.assertEqual(sorted(path.name for path in files), ["a.sh", "b.sh"])
+        self.assertTrue(all(path.parent == self.input_dir for path in files))
+    
+    def test_process_directory_single_file(self):
+        """Test that a single file is extracted"""
+        self._write_script("only.sh")
+        
+        success, output = self._process_directory()
+        
+        self.assertTrue(success)
+        self.assertIn("📄 Processing: only.sh", output)
+        self.assertIn("SELECT * FROM only;", (self.output_folder / "only.sql").read_text())
+    
+    def test_process_directory_multiple_files(self):
+        """Test that several files are extracted and listed in name order"""
+        for name in ("c.sh", "a.sh", "b.sh"):
+            self._write_script(name)
+        
+        success, output = self._process_directory()
+        
+        self.assertTrue(success)
+        self.assertIn("✅ Successfully processed: 3/3 files", output)
+        self.assertIn("   - a.sh\n   - b.sh\n   - c.sh\n", output)
+        self.assertIn("   - a.sql\n   - b.sql\n   - c.sql\n", output)
+        for stem in ("a", "b", "c"):
+            self.assertIn(f"SELECT * FROM {stem};", (self.output_folder / f"{stem}.sql").read_text())
+    
+    def test_process_directory_failed_file(self):
+        """Test that a file that cannot be read is reported as failed"""
+        for name in ("good.sh", "other.sh"):
+            self._write_script(name)
+        (self.input_dir / "bad.sh").write_bytes(b"bteq <<EOF\n\xff\xfe;\nEOF\n")
+        
+        success, output = self._process_directory()
+        
+        self.assertFalse(success)
+        self.assertIn("✅ Successfully processed: 2/3 files", output)
+        self.assertIn("❌ Failed files: bad.sh", output)
+        self.assertTrue((self.output_folder / "good.sql").exists())
+    
+    def test_process_directory_no_shell_files(self):
+        """Test that a directory without .sh files is reported as a failure"""
+        self._write_script("notes.txt")
+        
+        success, output = self._process_directory()
+        
+        self.assertFalse(success)
+        self.assertIn("❌ No .sh files found", output)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -5,8 +5,15 @@ This module contains comprehensive unit tests for the SQLGlotParser class
 and related dataclasses in the sqlglot_parser module.
 """
 
+import pickle
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
+from sqlglot import parse_one
+from sqlglot.dialects import Spark
+from sqlglot.expressions import (
+    Alias, Alter, Create, CTE, Delete, Drop, Insert, Merge, Select, Subquery, Table, Union, Update
+)
 from src.lineage_analyzer.sqlglot_parser import (
     SQLGlotParser,
     ParsedTable,
@@ -14,170 +21,146 @@ from src.lineage_analyzer.sqlglot_parser import (
 )
 
 
-class TestParsedTable:
-    """Test cases for the ParsedTable dataclass"""
+# Read-only statement mocks for operation type detection, which only
+# checks their class, so they are built once and shared
+_STATEMENT_MOCKS = {
+    statement_class: MagicMock(spec=statement_class)
+    for statement_class in (Select, Insert, Update, Delete, Create, Drop, Alter, Merge, CTE)
+}
 
-    def test_parsed_table_creation(self):
-        """Test basic ParsedTable creation"""
-        table = ParsedTable(
-            name="test_table",
-            alias="t",
-            schema="test_schema",
-            is_subquery=False
-        )
-        
-        assert table.name == "test_table"
-        assert table.alias == "t"
-        assert table.schema == "test_schema"
-        assert table.is_subquery is False
 
-    def test_parsed_table_full_name_with_schema(self):
-        """Test full_name property with schema"""
-        table = ParsedTable(
-            name="test_table",
-            schema="test_schema"
-        )
-        
-        assert table.full_name == "test_schema.test_table"
+# Names _is_valid_table_name should accept and reject
+_VALID_TABLE_NAMES = (
+    "table1",
+    "my_table",
+    "table_123",
+    "TableName",
+    "table_name_123",
+    "table_name_with_underscores",
+    "schema.table_name",
+)
+_INVALID_TABLE_NAMES = (
+    "",  # Empty
+    "   ",  # Whitespace only
+    "SELECT",  # SQL keyword
+    "A",  # Single letter
+    "B",  # Single letter
+    "1",  # Single digit
+    "table name",  # Contains space
+    "table-name",  # Contains hyphen
+)
 
-    def test_parsed_table_full_name_without_schema(self):
-        """Test full_name property without schema"""
-        table = ParsedTable(name="test_table")
-        
-        assert table.full_name == "test_table"
 
-    def test_parsed_table_defaults(self):
-        """Test ParsedTable with default values"""
-        table = ParsedTable(name="test_table")
-        
-        assert table.alias is None
-        assert table.schema is None
-        assert table.is_subquery is False
+# A simple MERGE statement; how much of MERGE SQLGlot can parse depends on
+# its version, so the MERGE test is skipped when this one fails to parse
+_MERGE_SQL = "MERGE INTO table1 USING (SELECT * FROM table2) AS t ON table1.id = t.id"
+_MERGE_SUPPORTED = SQLGlotParser().parse_sql_statement(_MERGE_SQL) is not None
 
-    # Integration tests for SQLGlotParser with real SQL parsing
-    def setup_method(self):
-        """Set up test fixtures for integration tests"""
-        self.parser = SQLGlotParser()
 
-    def test_parse_simple_select(self):
-        """Test parsing a simple SELECT statement"""
-        sql = "SELECT * FROM table1"
-        
-        result = self.parser.parse_sql_statement(sql, 1)
-        
-        assert result is not None
-        assert result.operation_type == "SELECT"
-        assert result.line_number == 1
-        assert result.sql_statement == sql
+class _SQLText:
+    """Stand-in for a parsed statement whose str() is the given SQL"""
 
-    def test_parse_simple_insert(self):
-        """Test parsing a simple INSERT statement"""
-        sql = "INSERT INTO table1 VALUES (1, 2, 3)"
-        
-        result = self.parser.parse_sql_statement(sql, 1)
-        
-        assert result is not None
-        assert result.operation_type == "INSERT"
-        assert result.line_number == 1
-        assert result.sql_statement == sql
+    def __init__(self, sql):
+        self.sql = sql
 
-    def test_parse_simple_update(self):
-        """Test parsing a simple UPDATE statement"""
-        sql = "UPDATE table1 SET col1 = 'value' WHERE id = 1"
-        
-        result = self.parser.parse_sql_statement(sql, 1)
-        
-        assert result is not None
-        assert result.operation_type == "UPDATE"
-        assert result.line_number == 1
-        assert result.sql_statement == sql
+    def __str__(self):
+        return self.sql
 
-    def test_parse_simple_delete(self):
-        """Test parsing a simple DELETE statement"""
-        sql = "DELETE FROM table1 WHERE id = 1"
-        
-        result = self.parser.parse_sql_statement(sql, 1)
-        
-        assert result is not None
-        assert result.operation_type == "DELETE"
-        assert result.line_number == 1
-        assert result.sql_statement == sql
 
-    def test_parse_create_table(self):
-        """Test parsing a CREATE TABLE statement"""
-        sql = "CREATE TABLE table1 (id INT, name VARCHAR(50))"
-        
-        result = self.parser.parse_sql_statement(sql, 1)
-        
-        assert result is not None
-        assert result.operation_type == "CREATE"
-        assert result.line_number == 1
-        assert result.sql_statement == sql
+def _assert_parsed(result, operation_type, target=None, schema=None, sources=(), sql=None):
+    """Assert a statement parsed at line 1 as the given operation type
 
-    def test_parse_drop_table(self):
-        """Test parsing a DROP TABLE statement"""
-        sql = "DROP TABLE table1"
-        
-        result = self.parser.parse_sql_statement(sql, 1)
-        
-        assert result is not None
-        assert result.operation_type == "DROP"
-        assert result.line_number == 1
+    The target schema is only compared when given, and the sources only
+    need to be a subset of the parsed source table names. The cleaned SQL
+    is only compared when the test's SQL needs no cleaning.
+    """
+    assert result is not None
+    assert result.operation_type == operation_type
+    assert result.line_number == 1
+    if target is not None:
+        assert result.target_table is not None
+        assert result.target_table.name == target
+        if schema is not None:
+            assert result.target_table.schema == schema
+    if sources:
+        assert set(sources) <= {table.name for table in result.source_tables}
+    if sql is not None:
         assert result.sql_statement == sql
 
-    def test_parse_alter_table(self):
-        """Test parsing an ALTER TABLE statement"""
-        sql = "ALTER TABLE table1 ADD COLUMN new_col INT"
-        
-        result = self.parser.parse_sql_statement(sql, 1)
+
+def _mock_table(this=None, db=None, catalog=None, name=None, **attrs):
+    """Build a Table-spec'd mock with the name parts the parser reads"""
+    table = MagicMock(spec=Table)
+    table.this = this
+    table.db = db
+    table.catalog = catalog
+    table.name = name
+    for attr, value in attrs.items():
+        setattr(table, attr, value)
+    return table
+
+
+class TestParsedTable:
+    """Test cases for the ParsedTable dataclass"""
+
+    @pytest.mark.parametrize("kwargs,full_name,alias,schema", [
+        (dict(name="test_table", alias="t", schema="test_schema", is_subquery=False),
+         "test_schema.test_table", "t", "test_schema"),
+        (dict(name="test_table", schema="test_schema"), "test_schema.test_table", None, "test_schema"),
+        (dict(name="test_table"), "test_table", None, None),
+    ], ids=["all_fields", "with_schema", "defaults"])
+    def test_parsed_table_fields(self, kwargs, full_name, alias, schema):
+        """Test ParsedTable fields, defaults and the full_name property"""
+        table = ParsedTable(**kwargs)
         
-        assert result is not None
-        assert result.operation_type == "ALTER"
-        assert result.line_number == 1
-        assert result.sql_statement == sql
+        assert table.name == "test_table"
+        assert table.full_name == full_name
+        assert table.alias == alias
+        assert table.schema == schema
+        assert table.is_subquery is False
 
-    def test_parse_merge_statement(self):
+    # Integration tests for SQLGlotParser with real SQL parsing
+    @pytest.mark.parametrize("sql,operation_type", [
+        ("SELECT * FROM table1", "SELECT"),
+        ("INSERT INTO table1 VALUES (1, 2, 3)", "INSERT"),
+        ("UPDATE table1 SET col1 = 'value' WHERE id = 1", "UPDATE"),
+        ("DELETE FROM table1 WHERE id = 1", "DELETE"),
+        ("CREATE TABLE table1 (id INT, name VARCHAR(50))", "CREATE"),
+        ("DROP TABLE table1", "DROP"),
+        ("ALTER TABLE table1 ADD COLUMN new_col INT", "ALTER"),
+    ], ids=["select", "insert", "update", "delete", "create", "drop", "alter"])
+    def test_parse_simple_statement(self, parser, sql, operation_type):
+        """Test parsing a simple statement of each operation type"""
+        result = parser.parse_sql_statement(sql, 1)
+        
+        _assert_parsed(result, operation_type, sql=sql)
+
+    @pytest.mark.skipif(not _MERGE_SUPPORTED, reason="MERGE statement parsing not supported by SQLGlot")
+    def test_parse_merge_statement(self, parser):
         """Test parsing a MERGE statement"""
-        # Use a simpler MERGE statement that SQLGlot can parse
-        sql = "MERGE INTO table1 USING (SELECT * FROM table2) AS t ON table1.id = t.id"
-        
-        result = self.parser.parse_sql_statement(sql, 1)
-        
-        # MERGE might not be fully supported by SQLGlot, so we test the fallback behavior
-        if result is not None:
-            assert result.operation_type == "MERGE"
-            assert result.line_number == 1
-            assert result.sql_statement == sql
-        else:
-            # If MERGE parsing fails, that's acceptable for this test
-            # as it depends on SQLGlot's MERGE support
-            pytest.skip("MERGE statement parsing not supported by SQLGlot")
-
-    def test_parse_volatile_table(self):
+        result = parser.parse_sql_statement(_MERGE_SQL, 1)
+        
+        _assert_parsed(result, "MERGE", sql=_MERGE_SQL)
+
+    def test_parse_volatile_table(self, parser):
         """Test parsing a CREATE VOLATILE TABLE statement"""
         sql = "CREATE VOLATILE TABLE temp_table AS (SELECT * FROM source_table)"
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "CREATE"
+        _assert_parsed(result, "CREATE", sql=sql)
         assert result.is_volatile is True
-        assert result.line_number == 1
-        assert result.sql_statement == sql
 
-    def test_parse_view(self):
+    def test_parse_view(self, parser):
         """Test parsing a CREATE VIEW statement"""
         sql = "CREATE VIEW view1 AS SELECT * FROM table1"
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "CREATE"
+        _assert_parsed(result, "CREATE", sql=sql)
         assert result.is_view is True
-        assert result.line_number == 1
-        assert result.sql_statement == sql
 
-    def test_parse_complex_select_with_joins(self):
+    def test_parse_complex_select_with_joins(self, parser):
         """Test parsing a complex SELECT with joins"""
         sql = """
         SELECT a.col1, b.col2, c.col3
@@ -187,13 +170,11 @@ class TestParsedTable:
         WHERE a.status = 'active'
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "SELECT"
-        assert result.line_number == 1
+        _assert_parsed(result, "SELECT")
 
-    def test_parse_cte_statement(self):
+    def test_parse_cte_statement(self, parser):
         """Test parsing a CTE statement"""
         sql = """
         WITH cte1 AS (
@@ -202,22 +183,20 @@ class TestParsedTable:
         SELECT * FROM cte1
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "SELECT"  # CTE should be parsed as SELECT
-        assert result.line_number == 1
+        _assert_parsed(result, "SELECT")  # CTE should be parsed as SELECT
 
-    def test_parse_invalid_sql(self):
+    def test_parse_invalid_sql(self, parser):
         """Test parsing invalid SQL"""
         sql = "INVALID SQL STATEMENT"
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
         # Should handle gracefully and return None
         assert result is None
 
-    def test_parse_sql_with_comments(self):
+    def test_parse_sql_with_comments(self, parser):
         """Test parsing SQL with comments"""
         sql = """
         -- This is a comment
@@ -225,7 +204,7 @@ class TestParsedTable:
         -- Another comment
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
         assert result is not None
         assert result.operation_type == "SELECT"
@@ -283,18 +262,20 @@ class TestParsedOperation:
 class TestSQLGlotParser:
     """Test cases for the SQLGlotParser class"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.parser = SQLGlotParser()
-
-    def test_parser_initialization(self):
+    def test_parser_initialization(self, parser):
         """Test SQLGlotParser initialization"""
-        assert self.parser.logger is not None
-        assert self.parser.dialect is not None
-        assert isinstance(self.parser.sql_keywords, set)
-        assert isinstance(self.parser.common_aliases, set)
+        assert parser.logger is not None
+        assert parser.dialect is not None
+        assert isinstance(parser.sql_keywords, set)
 
-    def test_clean_sql_basic(self):
+    def test_parser_pickle_round_trip(self):
+        """Test that a parser survives pickling, as process_folder workers need"""
+        restored = pickle.loads(pickle.dumps(SQLGlotParser("spark")))
+        
+        assert type(restored.dialect) is Spark
+        _assert_parsed(restored.parse_sql_statement("SELECT * FROM table1", 1), "SELECT")
+
+    def test_clean_sql_basic(self, parser):
         """Test basic SQL cleaning functionality"""
         sql = """
         -- This is a comment
@@ -302,12 +283,12 @@ class TestSQLGlotParser:
         -- Another comment
         """
         
-        cleaned = self.parser._clean_sql(sql)
+        cleaned = parser._clean_sql(sql)
         assert "-- This is a comment" not in cleaned
         assert "-- Another comment" not in cleaned
         assert "SELECT * FROM table1;" in cleaned
 
-    def test_clean_sql_empty_lines(self):
+    def test_clean_sql_empty_lines(self, parser):
         """Test SQL cleaning with empty lines"""
         sql = """
         -- Comment
@@ -316,383 +297,256 @@ class TestSQLGlotParser:
         -- Another comment
         """
         
-        cleaned = self.parser._clean_sql(sql)
+        cleaned = parser._clean_sql(sql)
         lines = cleaned.split('\n')
         # Should not have empty lines
         assert all(line.strip() for line in lines if line)
 
-    def test_clean_sql_no_comments(self):
+    def test_clean_sql_no_comments(self, parser):
         """Test SQL cleaning with no comments"""
         sql = "SELECT * FROM table1;"
-        cleaned = self.parser._clean_sql(sql)
+        cleaned = parser._clean_sql(sql)
         assert cleaned == sql
 
-    def test_clean_sql_empty_string(self):
+    def test_clean_sql_empty_string(self, parser):
         """Test SQL cleaning with empty string"""
         sql = ""
-        cleaned = self.parser._clean_sql(sql)
+        cleaned = parser._clean_sql(sql)
         assert cleaned == ""
 
-    def test_clean_sql_only_comments(self):
+    def test_clean_sql_only_comments(self, parser):
         """Test SQL cleaning with only comments"""
         sql = """
         -- This is a comment
         -- Another comment
         """
         
-        cleaned = self.parser._clean_sql(sql)
+        cleaned = parser._clean_sql(sql)
         assert cleaned == ""
 
-    def test_is_valid_table_name_valid_cases(self):
+    def test_clean_sql_trailing_comments_and_whitespace(self, parser):
+        """Test that only text before a comment is trimmed and other lines are kept as-is"""
+        sql = "SELECT a,   -- first column\n\n  b  \nFROM table1 --source\n   "
+        cleaned = parser._clean_sql(sql)
+        assert cleaned == "SELECT a,\n  b  \nFROM table1"
+
+    @pytest.mark.parametrize("name", _VALID_TABLE_NAMES)
+    def test_is_valid_table_name_valid_cases(self, parser, name):
         """Test valid table name validation"""
-        valid_names = [
-            "table1",
-            "my_table",
-            "table_123",
-            "TableName",
-            "table_name_123",
-            "table_name_with_underscores",
-            "schema.table_name"
-        ]
-        
-        for name in valid_names:
-            assert self.parser._is_valid_table_name(name), f"Should be valid: {name}"
-
-    def test_is_valid_table_name_invalid_cases(self):
+        assert parser._is_valid_table_name(name), f"Should be valid: {name}"
+
+    @pytest.mark.parametrize("name", _INVALID_TABLE_NAMES)
+    def test_is_valid_table_name_invalid_cases(self, parser, name):
         """Test invalid table name validation"""
-        invalid_names = [
-            "",  # Empty
-            "   ",  # Whitespace only
-            "SELECT",  # SQL keyword
-            "A",  # Single letter
-            "B",  # Single letter
-            "1",  # Single digit
-            "table name",  # Contains space
-            "table-name",  # Contains hyphen
-        ]
-        
-        for name in invalid_names:
-            assert not self.parser._is_valid_table_name(name), f"Should be invalid: {name}"
-
-    def test_is_volatile_table_true(self):
-        """Test volatile table detection"""
-        # Mock a Create object with VOLATILE in the SQL
-        mock_create = MagicMock()
-        mock_create.__str__ = MagicMock(return_value="CREATE VOLATILE TABLE test AS SELECT 1")
-        
-        result = self.parser._is_volatile_table(mock_create)
-        assert result is True
-
-    def test_is_volatile_table_false(self):
-        """Test non-volatile table detection"""
-        # Mock a Create object without VOLATILE in the SQL
-        mock_create = MagicMock()
-        mock_create.__str__ = MagicMock(return_value="CREATE TABLE test AS SELECT 1")
-        
-        result = self.parser._is_volatile_table(mock_create)
-        assert result is False
-
-    def test_is_view_true(self):
-        """Test view detection"""
-        # Mock a Create object with VIEW in the SQL
-        mock_create = MagicMock()
-        mock_create.__str__ = MagicMock(return_value="CREATE VIEW test AS SELECT 1")
-        
-        result = self.parser._is_view(mock_create)
-        assert result is True
-
-    def test_is_view_false(self):
-        """Test non-view detection"""
-        # Mock a Create object without VIEW in the SQL
-        mock_create = MagicMock()
-        mock_create.__str__ = MagicMock(return_value="CREATE TABLE test AS SELECT 1")
-        
-        result = self.parser._is_view(mock_create)
-        assert result is False
+        assert not parser._is_valid_table_name(name), f"Should be invalid: {name}"
+
+    @pytest.mark.parametrize("sql,is_volatile,is_view", [
+        ("CREATE VOLATILE TABLE test AS SELECT 1", True, False),
+        ("CREATE VIEW test AS SELECT 1", False, True),
+        ("CREATE TABLE test AS SELECT 1", False, False),
+    ], ids=["volatile", "view", "table"])
+    def test_is_volatile_table_and_view(self, parser, sql, is_volatile, is_view):
+        """Test volatile table and view detection from the CREATE statement text"""
+        create = _SQLText(sql)
+        
+        assert parser._is_volatile_table(create) is is_volatile
+        assert parser._is_view(create) is is_view
 
     @patch('src.lineage_analyzer.sqlglot_parser.parse_one')
-    def test_parse_sql_statement_success(self, mock_parse_one):
+    def test_parse_sql_statement_success(self, mock_parse_one, parser):
         """Test successful SQL statement parsing"""
         # Mock the parsed AST
-        mock_parsed = MagicMock()
-        mock_parse_one.return_value = mock_parsed
+        mock_parse_one.return_value = MagicMock()
+        mock_operation = ParsedOperation(
+            operation_type="SELECT",
+            target_table=None,
+            source_tables=[],
+            columns=[],
+            conditions=[],
+            line_number=1,
+            sql_statement="SELECT * FROM table1"
+        )
         
-        # Mock the operation type detection
-        with patch.object(self.parser, '_get_operation_type', return_value="SELECT"):
-            with patch.object(self.parser, '_parse_select') as mock_parse_select:
-                mock_operation = ParsedOperation(
-                    operation_type="SELECT",
-                    target_table=None,
-                    source_tables=[],
-                    columns=[],
-                    conditions=[],
-                    line_number=1,
-                    sql_statement="SELECT * FROM table1"
-                )
-                mock_parse_select.return_value = mock_operation
-                
-                result = self.parser.parse_sql_statement("SELECT * FROM table1", 1)
-                
-                assert result is not None
-                assert result.operation_type == "SELECT"
-                mock_parse_one.assert_called_once()
-                mock_parse_select.assert_called_once()
+        # Mock the operation type detection and the SELECT handler together
+        with patch.multiple(
+            parser,
+            _get_operation_type=MagicMock(return_value="SELECT"),
+            _parse_select=MagicMock(return_value=mock_operation),
+        ):
+            result = parser.parse_sql_statement("SELECT * FROM table1", 1)
+            
+            assert result is not None
+            assert result.operation_type == "SELECT"
+            mock_parse_one.assert_called_once()
+            parser._parse_select.assert_called_once()
 
     @patch('src.lineage_analyzer.sqlglot_parser.parse_one')
-    def test_parse_sql_statement_parse_failure(self, mock_parse_one):
+    def test_parse_sql_statement_parse_failure(self, mock_parse_one, parser):
         """Test SQL statement parsing failure"""
         mock_parse_one.return_value = None
         
-        result = self.parser.parse_sql_statement("INVALID SQL", 1)
+        result = parser.parse_sql_statement("INVALID SQL", 1)
         
         assert result is None
         mock_parse_one.assert_called_once()
 
     @patch('src.lineage_analyzer.sqlglot_parser.parse_one')
-    def test_parse_sql_statement_operation_type_failure(self, mock_parse_one):
+    def test_parse_sql_statement_operation_type_failure(self, mock_parse_one, parser):
         """Test SQL statement parsing with unknown operation type"""
         mock_parsed = MagicMock()
         mock_parse_one.return_value = mock_parsed
         
-        with patch.object(self.parser, '_get_operation_type', return_value=None):
-            result = self.parser.parse_sql_statement("UNKNOWN OPERATION", 1)
+        with patch.object(parser, '_get_operation_type', return_value=None):
+            result = parser.parse_sql_statement("UNKNOWN OPERATION", 1)
             
             assert result is None
 
     @patch('src.lineage_analyzer.sqlglot_parser.parse_one')
-    def test_parse_sql_statement_exception(self, mock_parse_one):
+    def test_parse_sql_statement_exception(self, mock_parse_one, parser):
         """Test SQL statement parsing with exception"""
         mock_parse_one.side_effect = Exception("Parse error")
         
-        result = self.parser.parse_sql_statement("SELECT * FROM table1", 1)
+        result = parser.parse_sql_statement("SELECT * FROM table1", 1)
         
         assert result is None
 
-    def test_parse_sql_statement_empty_sql(self):
+    @patch('src.lineage_analyzer.sqlglot_parser.parse_one')
+    def test_parse_sql_statement_empty_sql(self, mock_parse_one, parser):
         """Test parsing empty SQL statement"""
-        result = self.parser.parse_sql_statement("", 1)
+        result = parser.parse_sql_statement("", 1)
         assert result is None
+        mock_parse_one.assert_not_called()
 
-    def test_parse_sql_statement_whitespace_only(self):
+    @patch('src.lineage_analyzer.sqlglot_parser.parse_one')
+    def test_parse_sql_statement_whitespace_only(self, mock_parse_one, parser):
         """Test parsing whitespace-only SQL statement"""
-        result = self.parser.parse_sql_statement("   \n  \t  ", 1)
+        result = parser.parse_sql_statement("   \n  \t  ", 1)
         assert result is None
-
-    def test_get_operation_type_select(self):
-        """Test operation type detection for SELECT"""
-        from sqlglot.expressions import Select
-        mock_select = MagicMock(spec=Select)
-        
-        result = self.parser._get_operation_type(mock_select)
-        assert result == "SELECT"
-
-    def test_get_operation_type_insert(self):
-        """Test operation type detection for INSERT"""
-        from sqlglot.expressions import Insert
-        mock_insert = MagicMock(spec=Insert)
-        
-        result = self.parser._get_operation_type(mock_insert)
-        assert result == "INSERT"
-
-    def test_get_operation_type_update(self):
-        """Test operation type detection for UPDATE"""
-        from sqlglot.expressions import Update
-        mock_update = MagicMock(spec=Update)
-        
-        result = self.parser._get_operation_type(mock_update)
-        assert result == "UPDATE"
-
-    def test_get_operation_type_delete(self):
-        """Test operation type detection for DELETE"""
-        from sqlglot.expressions import Delete
-        mock_delete = MagicMock(spec=Delete)
-        
-        result = self.parser._get_operation_type(mock_delete)
-        assert result == "DELETE"
-
-    def test_get_operation_type_create(self):
-        """Test operation type detection for CREATE"""
-        from sqlglot.expressions import Create
-        mock_create = MagicMock(spec=Create)
-        
-        result = self.parser._get_operation_type(mock_create)
-        assert result == "CREATE"
-
-    def test_get_operation_type_drop(self):
-        """Test operation type detection for DROP"""
-        from sqlglot.expressions import Drop
-        mock_drop = MagicMock(spec=Drop)
-        
-        result = self.parser._get_operation_type(mock_drop)
-        assert result == "DROP"
-
-    def test_get_operation_type_alter(self):
-        """Test operation type detection for ALTER"""
-        from sqlglot.expressions import Alter
-        mock_alter = MagicMock(spec=Alter)
-        
-        result = self.parser._get_operation_type(mock_alter)
-        assert result == "ALTER"
-
-    def test_get_operation_type_merge(self):
-        """Test operation type detection for MERGE"""
-        from sqlglot.expressions import Merge
-        mock_merge = MagicMock(spec=Merge)
-        
-        result = self.parser._get_operation_type(mock_merge)
-        assert result == "MERGE"
-
-    def test_get_operation_type_cte(self):
-        """Test operation type detection for CTE"""
-        from sqlglot.expressions import CTE
-        mock_cte = MagicMock(spec=CTE)
-        
-        result = self.parser._get_operation_type(mock_cte)
-        assert result == "CTE"
-
-    def test_get_operation_type_other(self):
+        mock_parse_one.assert_not_called()
+
+    @pytest.mark.parametrize("statement_class,expected", [
+        (Select, "SELECT"),
+        (Insert, "INSERT"),
+        (Update, "UPDATE"),
+        (Delete, "DELETE"),
+        (Create, "CREATE"),
+        (Drop, "DROP"),
+        (Alter, "ALTER"),
+        (Merge, "MERGE"),
+        (CTE, "CTE"),
+    ], ids=lambda value: value if isinstance(value, str) else value.__name__)
+    def test_get_operation_type(self, parser, statement_class, expected):
+        """Test operation type detection for each statement class"""
+        result = parser._get_operation_type(_STATEMENT_MOCKS[statement_class])
+        assert result == expected
+
+    def test_get_operation_type_other(self, parser):
         """Test operation type detection for other types"""
-        mock_other = MagicMock()
-        mock_other.this = MagicMock()
+        other = SimpleNamespace(this=_STATEMENT_MOCKS[Select])
         
-        from sqlglot.expressions import Select
-        mock_other.this.__class__ = Select
-        
-        result = self.parser._get_operation_type(mock_other)
+        result = parser._get_operation_type(other)
         assert result == "SELECT"
 
-    def test_get_operation_type_unknown(self):
+    def test_get_operation_type_unknown(self, parser):
         """Test operation type detection for unknown types"""
-        mock_unknown = MagicMock()
-        mock_unknown.this = None
-        
-        result = self.parser._get_operation_type(mock_unknown)
+        result = parser._get_operation_type(SimpleNamespace(this=None))
         assert result == "OTHER"
 
-    def test_create_parsed_table_from_table_success(self):
+    def test_create_parsed_table_from_table_success(self, parser):
         """Test successful ParsedTable creation from Table object"""
-        from sqlglot.expressions import Table
-        
-        mock_table = MagicMock(spec=Table)
-        mock_table.this = "test_table"
-        mock_table.db = "test_schema"
-        mock_table.catalog = None
-        mock_table.name = None
+        mock_table = _mock_table(this="test_table", db="test_schema")
         
-        with patch.object(self.parser, '_is_valid_table_name', return_value=True):
-            result = self.parser._create_parsed_table_from_table(mock_table)
+        with patch.object(parser, '_is_valid_table_name', return_value=True):
+            result = parser._create_parsed_table_from_table(mock_table)
             
             assert result is not None
             assert result.name == "test_table"
             assert result.schema == "test_schema"
             assert result.is_subquery is False
 
-    def test_create_parsed_table_from_table_no_this(self):
+    def test_create_parsed_table_from_table_no_this(self, parser):
         """Test ParsedTable creation from Table object with no 'this' attribute"""
-        from sqlglot.expressions import Table
+        mock_table = _mock_table(this=None)
         
-        mock_table = MagicMock(spec=Table)
-        mock_table.this = None
-        
-        result = self.parser._create_parsed_table_from_table(mock_table)
+        result = parser._create_parsed_table_from_table(mock_table)
         assert result is None
 
-    def test_create_parsed_table_from_table_invalid_name(self):
+    def test_create_parsed_table_from_table_invalid_name(self, parser):
         """Test ParsedTable creation from Table object with invalid name"""
-        from sqlglot.expressions import Table
-        
-        mock_table = MagicMock(spec=Table)
-        mock_table.this = "SELECT"  # Invalid name (SQL keyword)
-        mock_table.db = None
-        mock_table.catalog = None
-        mock_table.name = None
+        mock_table = _mock_table(this="SELECT")  # Invalid name (SQL keyword)
         
-        with patch.object(self.parser, '_is_valid_table_name', return_value=False):
-            result = self.parser._create_parsed_table_from_table(mock_table)
+        with patch.object(parser, '_is_valid_table_name', return_value=False):
+            result = parser._create_parsed_table_from_table(mock_table)
             assert result is None
 
-    def test_create_parsed_table_from_table_schema_table_format(self):
+    def test_create_parsed_table_from_table_schema_table_format(self, parser):
         """Test ParsedTable creation with schema.table format"""
-        from sqlglot.expressions import Table
+        mock_table = _mock_table(this="schema.table_name")
         
-        mock_table = MagicMock(spec=Table)
-        mock_table.this = "schema.table_name"
-        mock_table.db = None
-        mock_table.catalog = None
-        mock_table.name = None
-        
-        with patch.object(self.parser, '_is_valid_table_name', return_value=True):
-            result = self.parser._create_parsed_table_from_table(mock_table)
+        with patch.object(parser, '_is_valid_table_name', return_value=True):
+            result = parser._create_parsed_table_from_table(mock_table)
             
             assert result is not None
             assert result.name == "table_name"
             assert result.schema == "schema"
 
-    def test_extract_tables_from_expression_table(self):
+    def test_extract_tables_from_expression_table(self, parser):
         """Test table extraction from Table expression"""
-        from sqlglot.expressions import Table
-        
-        mock_table = MagicMock(spec=Table)
-        mock_table.this = "test_table"
-        mock_table.db = None
-        mock_table.catalog = None
-        mock_table.name = None
+        mock_table = _mock_table(this="test_table")
         
-        with patch.object(self.parser, '_create_parsed_table_from_table') as mock_create:
+        with patch.object(parser, '_create_parsed_table_from_table') as mock_create:
             mock_parsed_table = ParsedTable(name="test_table")
             mock_create.return_value = mock_parsed_table
             
-            result = self.parser._extract_tables_from_expression(mock_table)
+            result = parser._extract_tables_from_expression(mock_table)
             
             assert len(result) == 1
             assert result[0] == mock_parsed_table
             mock_create.assert_called_once_with(mock_table)
 
-    def test_extract_tables_from_expression_alias(self):
+    def test_extract_tables_from_expression_alias(self, parser):
         """Test table extraction from Alias expression"""
-        from sqlglot.expressions import Alias, Table
-        
-        mock_table = MagicMock(spec=Table)
-        mock_table.this = "test_table"
-        mock_table.db = None
-        mock_table.catalog = None
-        mock_table.name = None
+        mock_table = _mock_table(this="test_table")
         
         mock_alias = MagicMock(spec=Alias)
         mock_alias.this = mock_table
         mock_alias.alias = "t"
         
-        with patch.object(self.parser, '_create_parsed_table_from_table') as mock_create:
+        with patch.object(parser, '_create_parsed_table_from_table') as mock_create:
             mock_parsed_table = ParsedTable(name="test_table")
             mock_create.return_value = mock_parsed_table
             
-            result = self.parser._extract_tables_from_expression(mock_alias)
+            result = parser._extract_tables_from_expression(mock_alias)
             
             assert len(result) == 1
             assert result[0] == mock_parsed_table
             assert result[0].alias == "t"
 
-    def test_extract_tables_from_expression_subquery(self):
+    def test_extract_tables_from_expression_subquery(self, parser):
         """Test table extraction from Subquery expression"""
-        from sqlglot.expressions import Subquery, Select
-        
         mock_select = MagicMock(spec=Select)
         mock_subquery = MagicMock(spec=Subquery)
         mock_subquery.this = mock_select
         
-        with patch.object(self.parser, '_extract_tables_from_select') as mock_extract:
+        with patch.object(parser, '_extract_tables_from_select') as mock_extract:
             mock_tables = [ParsedTable(name="table1")]
             mock_extract.return_value = mock_tables
             
-            result = self.parser._extract_tables_from_expression(mock_subquery)
+            result = parser._extract_tables_from_expression(mock_subquery)
             
             assert result == mock_tables
             mock_extract.assert_called_once_with(mock_select)
 
-    def test_extract_tables_from_expression_union(self):
-        """Test table extraction from Union expression"""
-        from sqlglot.expressions import Union, Select
+    def test_extract_tables_from_expression_leaf(self, parser):
+        """Test leaf expressions are skipped without recursing"""
+        expression = parse_one("SELECT INTERVAL '60' MINUTE").expressions[0]
         
+        with patch.object(parser, '_create_parsed_table_from_table') as mock_create:
+            assert parser._extract_tables_from_expression(expression) == []
+            mock_create.assert_not_called()
+
+    def test_extract_tables_from_expression_union(self, parser):
+        """Test table extraction from Union expression"""
         mock_left_select = MagicMock(spec=Select)
         mock_right_select = MagicMock(spec=Select)
         mock_union = MagicMock(spec=Union)
@@ -701,7 +555,7 @@ class TestSQLGlotParser:
         
         # Test that the method handles Union type correctly
         # We'll test the isinstance check and the recursive calls
-        result = self.parser._extract_tables_from_expression(mock_union)
+        result = parser._extract_tables_from_expression(mock_union)
         
         # The result should be a list (even if empty)
         assert isinstance(result, list)
@@ -709,50 +563,38 @@ class TestSQLGlotParser:
         # Test that the method recognizes Union type
         assert isinstance(mock_union, Union)
 
-    def test_build_alias_map_update(self):
+    def test_build_alias_map_update(self, parser):
         """Test alias map building for UPDATE statement"""
-        from sqlglot.expressions import Update
-        
         mock_update = MagicMock(spec=Update)
-        mock_update.args = {'from': MagicMock()}
+        mock_update.args = {'from': object()}
         
-        with patch.object(self.parser, '_extract_aliases_from_expression') as mock_extract:
-            result = self.parser._build_alias_map(mock_update)
+        with patch.object(parser, '_extract_aliases_from_expression') as mock_extract:
+            result = parser._build_alias_map(mock_update)
             
             assert isinstance(result, dict)
             mock_extract.assert_called_once()
 
-    def test_build_alias_map_select(self):
+    def test_build_alias_map_select(self, parser):
         """Test alias map building for SELECT statement"""
-        from sqlglot.expressions import Select
-        
         mock_select = MagicMock(spec=Select)
-        mock_select.args = {'from': MagicMock()}
+        mock_select.args = {'from': object()}
         
-        with patch.object(self.parser, '_extract_aliases_from_expression') as mock_extract:
-            result = self.parser._build_alias_map(mock_select)
+        with patch.object(parser, '_extract_aliases_from_expression') as mock_extract:
+            result = parser._build_alias_map(mock_select)
             
             assert isinstance(result, dict)
             mock_extract.assert_called_once()
 
-    def test_build_alias_map_other(self):
+    def test_build_alias_map_other(self, parser):
         """Test alias map building for other statement types"""
-        mock_other = MagicMock()
-        
-        result = self.parser._build_alias_map(mock_other)
+        result = parser._build_alias_map(SimpleNamespace())
         
         assert isinstance(result, dict)
         assert len(result) == 0
 
-    def test_extract_aliases_from_expression_alias(self):
+    def test_extract_aliases_from_expression_alias(self, parser):
         """Test alias extraction from Alias expression"""
-        from sqlglot.expressions import Alias, Table
-        
-        mock_table = MagicMock(spec=Table)
-        mock_table.this = "test_table"
-        mock_table.db = None
-        mock_table.catalog = None
-        mock_table.name = None
+        mock_table = _mock_table(this="test_table")
         
         mock_alias = MagicMock(spec=Alias)
         mock_alias.this = mock_table
@@ -760,283 +602,154 @@ class TestSQLGlotParser:
         
         alias_map = {}
         
-        with patch.object(self.parser, '_get_table_name', return_value="test_table"):
-            self.parser._extract_aliases_from_expression(mock_alias, alias_map)
+        with patch.object(parser, '_get_table_name', return_value="test_table"):
+            parser._extract_aliases_from_expression(mock_alias, alias_map)
             
             assert "t" in alias_map
             assert alias_map["t"] == "test_table"
 
-    def test_extract_aliases_from_expression_table_with_alias(self):
+    def test_extract_aliases_from_expression_table_with_alias(self, parser):
         """Test alias extraction from Table with alias"""
-        from sqlglot.expressions import Table
-        
-        mock_table = MagicMock(spec=Table)
-        mock_table.this = "test_table"
-        mock_table.db = None
-        mock_table.catalog = None
-        mock_table.name = None
-        mock_table.alias = "t"
+        mock_table = _mock_table(this="test_table", alias="t")
         
         alias_map = {}
         
-        with patch.object(self.parser, '_get_table_name', return_value="test_table"):
-            self.parser._extract_aliases_from_expression(mock_table, alias_map)
+        with patch.object(parser, '_get_table_name', return_value="test_table"):
+            parser._extract_aliases_from_expression(mock_table, alias_map)
             
             assert "t" in alias_map
             assert alias_map["t"] == "test_table"
 
-    def test_get_table_name_full_qualified(self):
+    def test_get_table_name_full_qualified(self, parser):
         """Test getting full qualified table name"""
-        from sqlglot.expressions import Table
-        
-        mock_table = MagicMock(spec=Table)
-        mock_table.catalog = "catalog"
-        mock_table.db = "schema"
-        mock_table.name = "table"
+        mock_table = _mock_table(catalog="catalog", db="schema", name="table")
         
-        result = self.parser._get_table_name(mock_table)
+        result = parser._get_table_name(mock_table)
         
         assert result == "catalog.schema.table"
 
-    def test_get_table_name_schema_table(self):
+    def test_get_table_name_schema_table(self, parser):
         """Test getting schema.table name"""
-        from sqlglot.expressions import Table
+        mock_table = _mock_table(db="schema", name="table")
         
-        mock_table = MagicMock(spec=Table)
-        mock_table.catalog = None
-        mock_table.db = "schema"
-        mock_table.name = "table"
-        
-        result = self.parser._get_table_name(mock_table)
+        result = parser._get_table_name(mock_table)
         
         assert result == "schema.table"
 
-    def test_get_table_name_table_only(self):
+    def test_get_table_name_table_only(self, parser):
         """Test getting table name only"""
-        from sqlglot.expressions import Table
-        
-        mock_table = MagicMock(spec=Table)
-        mock_table.catalog = None
-        mock_table.db = None
-        mock_table.name = "table"
+        mock_table = _mock_table(name="table")
         
-        result = self.parser._get_table_name(mock_table)
+        result = parser._get_table_name(mock_table)
         
         assert result == "table"
 
-    def test_get_table_name_none(self):
+    def test_get_table_name_none(self, parser):
         """Test getting table name from None table"""
-        result = self.parser._get_table_name(None)
+        result = parser._get_table_name(None)
         assert result is None
 
-    def test_get_table_name_empty(self):
+    def test_get_table_name_empty(self, parser):
         """Test getting table name from empty table"""
-        from sqlglot.expressions import Table
+        mock_table = _mock_table()
         
-        mock_table = MagicMock(spec=Table)
-        mock_table.catalog = None
-        mock_table.db = None
-        mock_table.name = None
-        
-        result = self.parser._get_table_name(mock_table)
+        result = parser._get_table_name(mock_table)
         assert result is None
 
     # Test placeholder methods that return empty lists
-    def test_extract_columns_from_select(self):
+    def test_extract_columns_from_select(self, parser):
         """Test column extraction from SELECT (placeholder)"""
-        from sqlglot.expressions import Select
-        
-        mock_select = MagicMock(spec=Select)
-        result = self.parser._extract_columns_from_select(mock_select)
+        select = Select()
+        result = parser._extract_columns_from_select(select)
         assert result == []
 
-    def test_extract_columns_from_insert(self):
+    def test_extract_columns_from_insert(self, parser):
         """Test column extraction from INSERT (placeholder)"""
-        from sqlglot.expressions import Insert
-        
-        mock_insert = MagicMock(spec=Insert)
-        result = self.parser._extract_columns_from_insert(mock_insert)
+        insert = Insert()
+        result = parser._extract_columns_from_insert(insert)
         assert result == []
 
-    def test_extract_columns_from_update(self):
+    def test_extract_columns_from_update(self, parser):
         """Test column extraction from UPDATE (placeholder)"""
-        from sqlglot.expressions import Update
-        
-        mock_update = MagicMock(spec=Update)
-        result = self.parser._extract_columns_from_update(mock_update)
+        update = Update()
+        result = parser._extract_columns_from_update(update)
         assert result == []
 
-    def test_extract_columns_from_create(self):
+    def test_extract_columns_from_create(self, parser):
         """Test column extraction from CREATE (placeholder)"""
-        from sqlglot.expressions import Create
-        
-        mock_create = MagicMock(spec=Create)
-        result = self.parser._extract_columns_from_create(mock_create)
+        create = Create()
+        result = parser._extract_columns_from_create(create)
         assert result == []
 
-    def test_extract_conditions_from_select(self):
+    def test_extract_conditions_from_select(self, parser):
         """Test condition extraction from SELECT (placeholder)"""
-        from sqlglot.expressions import Select
-        
-        mock_select = MagicMock(spec=Select)
-        result = self.parser._extract_conditions_from_select(mock_select)
+        select = Select()
+        result = parser._extract_conditions_from_select(select)
         assert result == []
 
-    def test_extract_conditions_from_update(self):
+    def test_extract_conditions_from_update(self, parser):
         """Test condition extraction from UPDATE (placeholder)"""
-        from sqlglot.expressions import Update
-        
-        mock_update = MagicMock(spec=Update)
-        result = self.parser._extract_conditions_from_update(mock_update)
+        update = Update()
+        result = parser._extract_conditions_from_update(update)
         assert result == []
 
-    def test_extract_conditions_from_delete(self):
+    def test_extract_conditions_from_delete(self, parser):
         """Test condition extraction from DELETE (placeholder)"""
-        from sqlglot.expressions import Delete
-        
-        mock_delete = MagicMock(spec=Delete)
-        result = self.parser._extract_conditions_from_delete(mock_delete)
+        delete = Delete()
+        result = parser._extract_conditions_from_delete(delete)
         assert result == []
 
     # Test target table extraction methods
-    def test_extract_target_table_from_insert(self):
-        """Test target table extraction from INSERT"""
-        from sqlglot.expressions import Insert
-        
-        mock_insert = MagicMock(spec=Insert)
-        mock_insert.this = MagicMock()
-        
-        with patch.object(self.parser, '_extract_tables_from_expression') as mock_extract:
-            mock_table = ParsedTable(name="target_table")
-            mock_extract.return_value = [mock_table]
-            
-            result = self.parser._extract_target_table_from_insert(mock_insert)
-            
-            assert result == mock_table
-            mock_extract.assert_called_once_with(mock_insert.this)
-
-    def test_extract_target_table_from_insert_no_this(self):
+    def test_extract_target_table_from_insert_no_this(self, parser):
         """Test target table extraction from INSERT with no this"""
-        from sqlglot.expressions import Insert
-        
         mock_insert = MagicMock(spec=Insert)
         mock_insert.this = None
         
-        result = self.parser._extract_target_table_from_insert(mock_insert)
+        result = parser._extract_target_table_from_insert(mock_insert)
         assert result is None
 
-    def test_extract_target_table_from_insert_no_tables(self):
+    def test_extract_target_table_from_insert_no_tables(self, parser):
         """Test target table extraction from INSERT with no tables"""
-        from sqlglot.expressions import Insert
-        
         mock_insert = MagicMock(spec=Insert)
-        mock_insert.this = MagicMock()
+        mock_insert.this = object()
         
-        with patch.object(self.parser, '_extract_tables_from_expression', return_value=[]):
-            result = self.parser._extract_target_table_from_insert(mock_insert)
+        with patch.object(parser, '_extract_tables_from_expression', return_value=[]):
+            result = parser._extract_target_table_from_insert(mock_insert)
             assert result is None
 
-    def test_extract_target_table_from_update(self):
+    def test_extract_target_table_from_update(self, parser):
         """Test target table extraction from UPDATE"""
-        from sqlglot.expressions import Update
-        
         mock_update = MagicMock(spec=Update)
-        mock_update.args = {'from': MagicMock()}
-        mock_update.this = MagicMock()
+        mock_update.args = {'from': object()}
+        mock_update.this = object()
         
-        with patch.object(self.parser, '_build_alias_map', return_value={}):
-            with patch.object(self.parser, '_extract_tables_from_expression') as mock_extract:
+        with patch.object(parser, '_build_alias_map', return_value={}):
+            with patch.object(parser, '_extract_tables_from_expression') as mock_extract:
                 mock_table = ParsedTable(name="target_table")
                 mock_extract.return_value = [mock_table]
                 
-                result = self.parser._extract_target_table_from_update(mock_update)
+                result = parser._extract_target_table_from_update(mock_update)
                 
                 assert result == mock_table
 
-    def test_extract_target_table_from_delete(self):
-        """Test target table extraction from DELETE"""
-        from sqlglot.expressions import Delete
-        
-        mock_delete = MagicMock(spec=Delete)
-        mock_delete.this = MagicMock()
-        
-        with patch.object(self.parser, '_extract_tables_from_expression') as mock_extract:
-            mock_table = ParsedTable(name="target_table")
-            mock_extract.return_value = [mock_table]
-            
-            result = self.parser._extract_target_table_from_delete(mock_delete)
-            
-            assert result == mock_table
-
-    def test_extract_target_table_from_create(self):
-        """Test target table extraction from CREATE"""
-        from sqlglot.expressions import Create
-        
-        mock_create = MagicMock(spec=Create)
-        mock_create.this = MagicMock()
-        
-        with patch.object(self.parser, '_extract_tables_from_expression') as mock_extract:
-            mock_table = ParsedTable(name="target_table")
-            mock_extract.return_value = [mock_table]
-            
-            result = self.parser._extract_target_table_from_create(mock_create)
-            
-            assert result == mock_table
-
-    def test_extract_target_table_from_drop(self):
-        """Test target table extraction from DROP"""
-        from sqlglot.expressions import Drop
-        
-        mock_drop = MagicMock(spec=Drop)
-        mock_drop.this = MagicMock()
-        
-        with patch.object(self.parser, '_extract_tables_from_expression') as mock_extract:
-            mock_table = ParsedTable(name="target_table")
-            mock_extract.return_value = [mock_table]
-            
-            result = self.parser._extract_target_table_from_drop(mock_drop)
-            
-            assert result == mock_table
-
-    def test_extract_target_table_from_alter(self):
-        """Test target table extraction from ALTER"""
-        from sqlglot.expressions import Alter
-        
-        mock_alter = MagicMock(spec=Alter)
-        mock_alter.this = MagicMock()
-        
-        with patch.object(self.parser, '_extract_tables_from_expression') as mock_extract:
-            mock_table = ParsedTable(name="target_table")
-            mock_extract.return_value = [mock_table]
-            
-            result = self.parser._extract_target_table_from_alter(mock_alter)
-            
-            assert result == mock_table
-
-    def test_extract_target_table_from_merge(self):
-        """Test target table extraction from MERGE"""
-        from sqlglot.expressions import Merge
-        
-        mock_merge = MagicMock(spec=Merge)
-        mock_merge.this = MagicMock()
+    @pytest.mark.parametrize("statement_class", [Insert, Delete, Create, Drop, Alter, Merge],
+                             ids=lambda statement_class: statement_class.__name__)
+    def test_extract_target_table(self, parser, statement_class):
+        """Test target table extraction from the statement's 'this' expression"""
+        statement = MagicMock(spec=statement_class)
+        statement.this = object()
+        method = getattr(parser, f"_extract_target_table_from_{statement_class.__name__.lower()}")
+        target_table = ParsedTable(name="target_table")
         
-        with patch.object(self.parser, '_extract_tables_from_expression') as mock_extract:
-            mock_table = ParsedTable(name="target_table")
-            mock_extract.return_value = [mock_table]
-            
-            result = self.parser._extract_target_table_from_merge(mock_merge)
-            
-            assert result == mock_table
+        with patch.object(parser, '_extract_tables_from_expression', return_value=[target_table]) as mock_extract:
+            assert method(statement) == target_table
+            mock_extract.assert_called_once_with(statement.this)
 
 
 class TestSQLGlotParserRealistic:
     """Realistic integration tests based on actual SQL patterns"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.parser = SQLGlotParser()
-
-    def test_complex_insert_with_subquery_and_functions(self):
+    def test_complex_insert_with_subquery_and_functions(self, parser):
         """Test complex INSERT with subquery, functions, and complex WHERE clause"""
         sql = """
         INSERT INTO PROD.ORDER_RESPONSE_MSG
@@ -1087,18 +800,12 @@ class TestSQLGlotParserRealistic:
         AND TIB_INSERT_TIME > (CURRENT_TIMESTAMP(0) - INTERVAL '30' MINUTE);
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "INSERT"
-        assert result.target_table is not None
-        assert result.target_table.name == "ORDER_RESPONSE_MSG"
-        assert result.target_table.schema == "PROD"
-        assert len(result.source_tables) > 0
-        assert any(table.name == "ORDER_RESPONSE_MSG_NEW_V" for table in result.source_tables)
-        assert any(table.name == "ORDER_RESPONSE_MSG_LATEST_V" for table in result.source_tables)
+        _assert_parsed(result, "INSERT", "ORDER_RESPONSE_MSG", "PROD",
+                       sources=["ORDER_RESPONSE_MSG_NEW_V", "ORDER_RESPONSE_MSG_LATEST_V"])
 
-    def test_create_volatile_table_with_complex_joins(self):
+    def test_create_volatile_table_with_complex_joins(self, parser):
         """Test CREATE VOLATILE TABLE with complex joins and CASE statements"""
         sql = """
         CREATE MULTISET VOLATILE TABLE PROD_SHIP_ORDER_N AS
@@ -1117,18 +824,13 @@ class TestSQLGlotParserRealistic:
         ) WITH DATA ON COMMIT PRESERVE ROWS;
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "CREATE"
+        _assert_parsed(result, "CREATE", "PROD_SHIP_ORDER_N",
+                       sources=["PROD_SHIP_ORDER_V", "PROD_RESP_MSG_LM_V"])
         assert result.is_volatile is True
-        assert result.target_table is not None
-        assert result.target_table.name == "PROD_SHIP_ORDER_N"
-        assert len(result.source_tables) > 0
-        assert any(table.name == "PROD_SHIP_ORDER_V" for table in result.source_tables)
-        assert any(table.name == "PROD_RESP_MSG_LM_V" for table in result.source_tables)
 
-    def test_complex_update_with_from_clause(self):
+    def test_complex_update_with_from_clause(self, parser):
         """Test UPDATE with FROM clause and subquery"""
         sql = """
         UPDATE A 
@@ -1143,18 +845,13 @@ class TestSQLGlotParserRealistic:
         AND LAST_EVENTS_INDICATOR = 'Y';
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "UPDATE"
-        assert result.target_table is not None
-        assert result.target_table.name == "ORDER_BATCH_ID_ASSOCIATION"
-        assert len(result.source_tables) > 0
-        assert any(table.name == "ORDER_BATCH_ID_ASSOCIATION" for table in result.source_tables)
-        assert any(table.name == "PROD_ORDER_COMPLETE_N" for table in result.source_tables)
-        assert any(table.name == "COMPLETE_ORDER_DIFFUSION_BATCH_V" for table in result.source_tables)
+        _assert_parsed(result, "UPDATE", "ORDER_BATCH_ID_ASSOCIATION",
+                       sources=["ORDER_BATCH_ID_ASSOCIATION", "PROD_ORDER_COMPLETE_N",
+                                "COMPLETE_ORDER_DIFFUSION_BATCH_V"])
 
-    def test_delete_with_in_subquery(self):
+    def test_delete_with_in_subquery(self, parser):
         """Test DELETE with IN subquery"""
         sql = """
         DELETE FROM PROD_BASE_T.ORDER_FIRST_LAST_FAB 
@@ -1165,19 +862,14 @@ class TestSQLGlotParserRealistic:
         );
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "DELETE"
-        assert result.target_table is not None
-        assert result.target_table.name == "ORDER_FIRST_LAST_FAB"
-        assert result.target_table.schema == "PROD_BASE_T"
         # With the fix, should now extract tables from subqueries in WHERE clauses
-        assert len(result.source_tables) > 0
-        assert any(table.name == "PROD_ORDER_V" for table in result.source_tables)
-        assert any(table.schema == "PROD" for table in result.source_tables)
+        _assert_parsed(result, "DELETE", "ORDER_FIRST_LAST_FAB", "PROD_BASE_T",
+                       sources=["PROD_ORDER_V"])
+        assert ("PROD", "PROD_ORDER_V") in {(table.schema, table.name) for table in result.source_tables}
 
-    def test_delete_with_complex_subquery_and_joins(self):
+    def test_delete_with_complex_subquery_and_joins(self, parser):
         """Test DELETE with complex subquery containing multiple joins"""
         sql = """
         DELETE
@@ -1194,41 +886,32 @@ class TestSQLGlotParserRealistic:
                                             WHERE SRC_PLANT = 'NL74');
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "DELETE"
-        assert result.target_table is not None
-        assert result.target_table.name == "lot_first_last_fab"
-        assert result.target_table.schema == "LOTMASTER_BASE_T"
+        _assert_parsed(result, "DELETE", "lot_first_last_fab", "LOTMASTER_BASE_T")
         
         # Should extract all source tables from the subquery
         assert len(result.source_tables) == 5
         
         # Check that all expected source tables are present
-        table_names = [table.name for table in result.source_tables]
-        table_schemas = [table.schema for table in result.source_tables]
+        qualified_names = {(table.schema, table.name) for table in result.source_tables}
         
         # Check BIZT.BIZT_GI_GR_V
-        assert "BIZT_GI_GR_V" in table_names
-        assert "BIZT" in table_schemas
+        assert ("BIZT", "BIZT_GI_GR_V") in qualified_names
         
         # Check BATCHCHARACTERISTICSDATA_N (no schema)
-        assert "BATCHCHARACTERISTICSDATA_N" in table_names
-        assert any(table.name == "BATCHCHARACTERISTICSDATA_N" and table.schema is None for table in result.source_tables)
+        assert (None, "BATCHCHARACTERISTICSDATA_N") in qualified_names
         
         # Check lotmaster.lot_first_last_fab (different schema than target)
-        assert "lot_first_last_fab" in table_names
-        assert any(table.name == "lot_first_last_fab" and table.schema == "lotmaster" for table in result.source_tables)
+        assert ("lotmaster", "lot_first_last_fab") in qualified_names
         
         # Check REFERENCE.MATERIAL
-        assert "MATERIAL" in table_names
-        assert "REFERENCE" in table_schemas
+        assert ("REFERENCE", "MATERIAL") in qualified_names
         
         # Check LOTMASTER_BASE_T.lot_first_last_fab (self-reference in subquery)
-        assert any(table.name == "lot_first_last_fab" and table.schema == "LOTMASTER_BASE_T" for table in result.source_tables)
+        assert ("LOTMASTER_BASE_T", "lot_first_last_fab") in qualified_names
 
-    def test_complex_select_with_multiple_joins(self):
+    def test_complex_select_with_multiple_joins(self, parser):
         """Test complex SELECT with multiple LEFT OUTER JOINs"""
         sql = """
         SELECT DISTINCT 
@@ -1271,22 +954,16 @@ class TestSQLGlotParserRealistic:
         );
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "SELECT"
-        assert result.target_table is None  # SELECT doesn't have target table
-        assert len(result.source_tables) > 0
         # Check for all the joined tables
-        table_names = [table.name for table in result.source_tables]
-        assert "PROMIS_PROD_ORDER_START_V" in table_names
-        assert "PROMIS_START_ORDER_SOURCE_ORDER_LIST_V" in table_names
-        assert "ORDER_MAST_OUT_CNTL" in table_names
-        assert "ORDER_ID_ASGNMT" in table_names
-        assert "MFG_ORDER_ACTV" in table_names
-        assert "PROD_RESP_MSG_LM_V" in table_names
-
-    def test_create_volatile_table_with_window_function(self):
+        _assert_parsed(result, "SELECT",
+                       sources=["PROMIS_PROD_ORDER_START_V", "PROMIS_START_ORDER_SOURCE_ORDER_LIST_V",
+                                "ORDER_MAST_OUT_CNTL", "ORDER_ID_ASGNMT", "MFG_ORDER_ACTV",
+                                "PROD_RESP_MSG_LM_V"])
+        assert result.target_table is None  # SELECT doesn't have target table
+
+    def test_create_volatile_table_with_window_function(self, parser):
         """Test CREATE VOLATILE TABLE with window function and QUALIFY"""
         sql = """
         CREATE MULTISET VOLATILE TABLE VT_LAST_FAB_ORDER AS
@@ -1312,20 +989,15 @@ class TestSQLGlotParserRealistic:
         ) WITH DATA ON COMMIT PRESERVE ROWS;
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "CREATE"
+        _assert_parsed(result, "CREATE", "VT_LAST_FAB_ORDER",
+                       sources=["MFG_ORDER_ACTV", "PROMIS_START_ORDER_SOURCE_ORDER_LIST_V"])
         assert result.is_volatile is True
-        assert result.target_table is not None
-        assert result.target_table.name == "VT_LAST_FAB_ORDER"
-        assert len(result.source_tables) > 0
-        assert any(table.name == "MFG_ORDER_ACTV" for table in result.source_tables)
-        assert any(table.name == "PROMIS_START_ORDER_SOURCE_ORDER_LIST_V" for table in result.source_tables)
         # Note: Subquery in WHERE clause may not be extracted by current implementation
-        # assert any(table.name == "PROD_RESP_MSG_LM_V" for table in result.source_tables)
+        # sources=["MFG_ORDER_ACTV", "PROMIS_START_ORDER_SOURCE_ORDER_LIST_V", "PROD_RESP_MSG_LM_V"]
 
-    def test_insert_with_values_and_functions(self):
+    def test_insert_with_values_and_functions(self, parser):
         """Test INSERT with VALUES and various functions"""
         sql = """
         INSERT INTO PROD_BASE_T.ORDER_SO_DTL
@@ -1395,17 +1067,12 @@ class TestSQLGlotParserRealistic:
         FROM PROD_SHIP_ORDER_N;
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "INSERT"
-        assert result.target_table is not None
-        assert result.target_table.name == "ORDER_SO_DTL"
-        assert result.target_table.schema == "PROD_BASE_T"
-        assert len(result.source_tables) > 0
-        assert any(table.name == "PROD_SHIP_ORDER_N" for table in result.source_tables)
+        _assert_parsed(result, "INSERT", "ORDER_SO_DTL", "PROD_BASE_T",
+                       sources=["PROD_SHIP_ORDER_N"])
 
-    def test_create_view_with_complex_logic(self):
+    def test_create_view_with_complex_logic(self, parser):
         """Test CREATE VIEW with complex business logic"""
         sql = """
         CREATE VIEW PROD.ORDER_BATCH_CHARACTERISTICS_DATA_V AS
@@ -1429,47 +1096,31 @@ class TestSQLGlotParserRealistic:
         AND CHARACTERISTIC_VALUE IS NOT NULL;
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "CREATE"
+        _assert_parsed(result, "CREATE", "ORDER_BATCH_CHARACTERISTICS_DATA_V", "PROD",
+                       sources=["ORDER_BATCH_CHARACTERISTICS_DATA"])
         assert result.is_view is True
-        assert result.target_table is not None
-        assert result.target_table.name == "ORDER_BATCH_CHARACTERISTICS_DATA_V"
-        assert result.target_table.schema == "PROD"
-        assert len(result.source_tables) > 0
-        assert any(table.name == "ORDER_BATCH_CHARACTERISTICS_DATA" for table in result.source_tables)
-
-    def test_drop_table_statement(self):
-        """Test DROP TABLE statement"""
-        sql = "DROP TABLE PROD.TEMP_ORDER_DATA;"
-        
-        result = self.parser.parse_sql_statement(sql, 1)
-        
-        assert result is not None
-        assert result.operation_type == "DROP"
-        assert result.target_table is not None
-        assert result.target_table.name == "TEMP_ORDER_DATA"
-        assert result.target_table.schema == "PROD"
-        assert len(result.source_tables) == 0
 
-    def test_alter_table_statement(self):
-        """Test ALTER TABLE statement"""
-        sql = """
+    @pytest.mark.parametrize("sql,operation_type,target_name", [
+        ("DROP TABLE PROD.TEMP_ORDER_DATA;", "DROP", "TEMP_ORDER_DATA"),
+        ("""
         ALTER TABLE PROD.ORDER_MASTER 
         ADD COLUMN NEW_ATTRIBUTE VARCHAR(100);
-        """
-        
-        result = self.parser.parse_sql_statement(sql, 1)
+        """, "ALTER", "ORDER_MASTER"),
+    ], ids=["drop_table", "alter_table"])
+    def test_ddl_statement_without_sources(self, parser, sql, operation_type, target_name):
+        """Test DROP/ALTER TABLE statements, which have a target and no sources"""
+        result = parser.parse_sql_statement(sql, 1)
         
         assert result is not None
-        assert result.operation_type == "ALTER"
+        assert result.operation_type == operation_type
         assert result.target_table is not None
-        assert result.target_table.name == "ORDER_MASTER"
+        assert result.target_table.name == target_name
         assert result.target_table.schema == "PROD"
         assert len(result.source_tables) == 0
 
-    def test_complex_where_clause_with_functions(self):
+    def test_complex_where_clause_with_functions(self, parser):
         """Test complex WHERE clause with various functions"""
         sql = """
         SELECT 
@@ -1494,21 +1145,16 @@ class TestSQLGlotParserRealistic:
         );
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "SELECT"
-        assert len(result.source_tables) > 0
-        table_names = [table.name for table in result.source_tables]
-        assert "ORDER_MASTER" in table_names
+        _assert_parsed(result, "SELECT", sources=["ORDER_MASTER"])
         # Note: Current implementation may not extract tables from subqueries in WHERE clauses
         # These assertions document the current behavior
-        # assert "ORDER_EXCEPTIONS" in table_names
-        # assert "ORDER_DETAILS" in table_names
+        # sources=["ORDER_MASTER", "ORDER_EXCEPTIONS", "ORDER_DETAILS"]
 
-    def test_union_all_statement(self):
-        """Test UNION ALL statement"""
-        sql = """
+    @pytest.mark.parametrize("sql", [
+        # UNION ALL
+        """
         SELECT ORDER_ID, ORDER_STATUS, 'ACTIVE' as SOURCE
         FROM PROD.ACTIVE_ORDERS
         WHERE ORDER_DATE >= CURRENT_DATE - INTERVAL '30' DAY
@@ -1517,19 +1163,9 @@ class TestSQLGlotParserRealistic:
         FROM PROD.HISTORICAL_ORDERS
         WHERE ORDER_DATE >= CURRENT_DATE - INTERVAL '90' DAY
         AND ORDER_STATUS = 'COMPLETED';
+        """,
+        # Recursive CTE
         """
-        
-        result = self.parser.parse_sql_statement(sql, 1)
-        
-        assert result is not None
-        assert result.operation_type == "SELECT"  # UNION is parsed as SELECT
-        # Note: Current implementation may not extract tables from UNION statements
-        # This test documents the current behavior
-        assert len(result.source_tables) >= 0  # May be empty due to UNION limitations
-
-    def test_cte_with_recursive_logic(self):
-        """Test Common Table Expression (CTE) with recursive logic"""
-        sql = """
         WITH RECURSIVE ORDER_HIERARCHY AS (
             SELECT 
                 ORDER_ID,
@@ -1538,9 +1174,9 @@ class TestSQLGlotParserRealistic:
                 1 as HIERARCHY_LEVEL
             FROM PROD.ORDER_MASTER
             WHERE PARENT_ORDER_ID IS NULL
-            
+        
             UNION ALL
-            
+        
             SELECT 
                 OM.ORDER_ID,
                 OM.PARENT_ORDER_ID,
@@ -1558,17 +1194,19 @@ class TestSQLGlotParserRealistic:
             HIERARCHY_LEVEL
         FROM ORDER_HIERARCHY
         ORDER BY HIERARCHY_LEVEL, ORDER_ID;
-        """
-        
-        result = self.parser.parse_sql_statement(sql, 1)
+        """,
+    ], ids=["union_all", "recursive_cte"])
+    def test_set_operation_statement(self, parser, sql):
+        """Test UNION ALL and recursive CTE statements, which parse as SELECT"""
+        result = parser.parse_sql_statement(sql, 1)
         
         assert result is not None
-        assert result.operation_type == "SELECT"  # CTE is parsed as SELECT
-        # Note: Current implementation may not extract tables from CTE statements
+        assert result.operation_type == "SELECT"
+        # Note: Current implementation may not extract tables from UNION or CTE statements
         # This test documents the current behavior
-        assert len(result.source_tables) >= 0  # May be empty due to CTE limitations
+        assert len(result.source_tables) >= 0  # May be empty due to UNION/CTE limitations
 
-    def test_complex_case_statement(self):
+    def test_complex_case_statement(self, parser):
         """Test complex CASE statement with nested conditions"""
         sql = """
         SELECT 
@@ -1593,14 +1231,11 @@ class TestSQLGlotParserRealistic:
         WHERE ORDER_DATE >= CURRENT_DATE - INTERVAL '1' YEAR;
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "SELECT"
-        assert len(result.source_tables) > 0
-        assert any(table.name == "ORDER_MASTER" for table in result.source_tables)
+        _assert_parsed(result, "SELECT", sources=["ORDER_MASTER"])
 
-    def test_individual_sql_statements(self):
+    def test_individual_sql_statements(self, parser):
         """Test individual SQL statements separately"""
         # Test CREATE VOLATILE TABLE
         create_sql = """
@@ -1609,15 +1244,15 @@ class TestSQLGlotParserRealistic:
         ) WITH DATA ON COMMIT PRESERVE ROWS
         """
         
-        create_result = self.parser.parse_sql_statement(create_sql, 1)
+        create_result = parser.parse_sql_statement(create_sql, 1)
         assert create_result is not None
         assert create_result.operation_type == "CREATE"
         assert create_result.is_volatile is True
         assert create_result.target_table.name == "TEMP_ORDER_DATA"
         # Check source table
         assert len(create_result.source_tables) == 1
-        assert any(table.name == "ORDER_MASTER" for table in create_result.source_tables)
-        assert any(table.schema == "PROD" for table in create_result.source_tables)
+        create_qualified_names = {(table.schema, table.name) for table in create_result.source_tables}
+        assert ("PROD", "ORDER_MASTER") in create_qualified_names
         
         # Test INSERT statement
         insert_sql = """
@@ -1630,27 +1265,27 @@ class TestSQLGlotParserRealistic:
         GROUP BY ORDER_STATUS
         """
         
-        insert_result = self.parser.parse_sql_statement(insert_sql, 2)
+        insert_result = parser.parse_sql_statement(insert_sql, 2)
         assert insert_result is not None
         assert insert_result.operation_type == "INSERT"
         assert insert_result.target_table.name == "ORDER_SUMMARY"
         assert insert_result.target_table.schema == "PROD"
         # Check source table - INSERT should include both target and source tables
         assert len(insert_result.source_tables) == 2
-        assert any(table.name == "TEMP_ORDER_DATA" for table in insert_result.source_tables)
-        assert any(table.name == "ORDER_SUMMARY" for table in insert_result.source_tables)
+        insert_table_names = {table.name for table in insert_result.source_tables}
+        assert {"TEMP_ORDER_DATA", "ORDER_SUMMARY"} <= insert_table_names
         
         # Test DROP statement
         drop_sql = "DROP TABLE TEMP_ORDER_DATA"
         
-        drop_result = self.parser.parse_sql_statement(drop_sql, 3)
+        drop_result = parser.parse_sql_statement(drop_sql, 3)
         assert drop_result is not None
         assert drop_result.operation_type == "DROP"
         assert drop_result.target_table.name == "TEMP_ORDER_DATA"
         # DROP statements typically don't have source tables
         assert len(drop_result.source_tables) == 0
 
-    def test_teradata_specific_functions(self):
+    def test_teradata_specific_functions(self, parser):
         """Test Teradata-specific functions and syntax"""
         sql = """
         SELECT 
@@ -1669,14 +1304,11 @@ class TestSQLGlotParserRealistic:
                           AND CURRENT_DATE;
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "SELECT"
-        assert len(result.source_tables) > 0
-        assert any(table.name == "ORDER_MASTER" for table in result.source_tables)
+        _assert_parsed(result, "SELECT", sources=["ORDER_MASTER"])
 
-    def test_complex_join_conditions(self):
+    def test_complex_join_conditions(self, parser):
         """Test complex JOIN conditions with multiple criteria"""
         sql = """
         SELECT 
@@ -1699,18 +1331,13 @@ class TestSQLGlotParserRealistic:
         AND A.ORDER_DATE >= CURRENT_DATE - INTERVAL '90' DAY;
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "SELECT"
+        _assert_parsed(result, "SELECT",
+                       sources=["ORDER_MASTER", "CUSTOMER_MASTER", "PRODUCT_CATALOG", "SUPPLIER_MASTER"])
         assert len(result.source_tables) == 4
-        table_names = [table.name for table in result.source_tables]
-        assert "ORDER_MASTER" in table_names
-        assert "CUSTOMER_MASTER" in table_names
-        assert "PRODUCT_CATALOG" in table_names
-        assert "SUPPLIER_MASTER" in table_names
 
-    def test_create_volatile_table_with_subquery_in_where(self):
+    def test_create_volatile_table_with_subquery_in_where(self, parser):
         """Test CREATE VOLATILE TABLE with subquery in WHERE clause"""
         sql = """
         CREATE MULTISET VOLATILE TABLE PROD_MODIFY_ORDER_TYPE_N AS
@@ -1739,21 +1366,11 @@ class TestSQLGlotParserRealistic:
         ON COMMIT PRESERVE ROWS;
         """
         
-        result = self.parser.parse_sql_statement(sql, 1)
+        result = parser.parse_sql_statement(sql, 1)
         
-        assert result is not None
-        assert result.operation_type == "CREATE"
+        # Check main source tables, and that the subquery table is also
+        # included as a source table
+        _assert_parsed(result, "CREATE", "PROD_MODIFY_ORDER_TYPE_N",
+                       sources=["PROD_MODIFY_ORDER_TYPE_V", "TXNMODIFYORDERTYPEDETAIL",
+                                "ORDER_ID_ASGNMT", "MFG_ORDER_ACTV", "PROD_RESP_MSG_LM_V"])
         assert result.is_volatile is True
-        assert result.target_table is not None
-        assert result.target_table.name == "PROD_MODIFY_ORDER_TYPE_N"
-        assert len(result.source_tables) > 0
-        
-        # Check main source tables
-        table_names = [table.name for table in result.source_tables]
-        assert "PROD_MODIFY_ORDER_TYPE_V" in table_names
-        assert "TXNMODIFYORDERTYPEDETAIL" in table_names
-        assert "ORDER_ID_ASGNMT" in table_names
-        assert "MFG_ORDER_ACTV" in table_names
-        
-        # Check that subquery table is also included as source table
-        assert "PROD_RESP_MSG_LM_V" in table_names